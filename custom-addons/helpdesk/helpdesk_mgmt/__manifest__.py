@@ -4,7 +4,7 @@
     "name": "Helpdesk Management",
     "summary": """
         Helpdesk""",
-    "version": "17.0.1.10.1",
+    "version": "17.0.1.12.8",
     "license": "AGPL-3",
     "category": "After-Sales",
     "author": "AdaptiveCity, "
@@ -32,6 +32,7 @@
         "views/helpdesk_ticket_tag_views.xml",
         "views/helpdesk_ticket_views.xml",
         "views/helpdesk_dashboard_views.xml",
+        "views/helpdesk_cron_run_views.xml",
     ],
     "demo": ["demo/helpdesk_demo.xml"],
     "assets": {
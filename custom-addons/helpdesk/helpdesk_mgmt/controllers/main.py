@@ -68,6 +68,21 @@ class HelpdeskTicketController(http.Controller):
             },
         )
 
+    @http.route("/new/ticket/similar", type="json", auth="user")
+    def similar_tickets(self, subject="", **kw):
+        """Suggest the existing tickets of the customer while typing a subject"""
+        tickets = request.env["helpdesk.ticket"]._get_portal_similar_tickets(subject)
+        return [
+            {
+                "number": ticket.number,
+                "name": ticket.name,
+                "stage": ticket.stage_id.name,
+                "closed": ticket.closed,
+                "url": ticket.access_url,
+            }
+            for ticket in tickets
+        ]
+
     def _prepare_submit_ticket_vals(self, **kw):
         category = http.request.env["helpdesk.ticket.category"].browse(
             int(kw.get("category") or 0)
@@ -1,3 +1,4 @@
+from . import helpdesk_batch_mixin
 from . import helpdesk_ticket
 from . import helpdesk_ticket_stage
 from . import helpdesk_ticket_tag
@@ -9,3 +10,4 @@ from . import res_company
 from . import res_config_settings
 from . import res_partner
 from . import res_users
+from . import helpdesk_cron_run
@@ -0,0 +1,28 @@
+from odoo import models
+from odoo.tools import split_every
+
+
+class HelpdeskBatchMixin(models.AbstractModel):
+    _name = "helpdesk.batch.mixin"
+    _description = "Helpdesk Batch Processing Mixin"
+
+    def _iter_chunks(self, size=1000, fnames=None, auto_commit=False):
+        """Iterate over ``self`` by chunks of ``size`` records.
+
+        Batch code should use it instead of looping over big recordsets so
+        memory stays flat: each chunk only prefetches its own records (and
+        ``fnames`` upfront when given), and once the caller is done with a
+        chunk pending changes are flushed, committed if ``auto_commit`` is
+        set, and the ORM cache is cleared, including the records read or
+        created while processing the chunk. Records kept by the caller
+        across chunks are fetched again when used.
+        """
+        for ids in split_every(size, self.ids):
+            chunk = self.browse(ids)
+            if fnames:
+                chunk.fetch(fnames)
+            yield chunk
+            self.env.flush_all()
+            if auto_commit:
+                self.env.cr.commit()
+            self.env.invalidate_all()
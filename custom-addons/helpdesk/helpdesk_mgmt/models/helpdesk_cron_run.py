@@ -0,0 +1,133 @@
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import timedelta
+
+import psutil
+
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+
+class HelpdeskCronRun(models.Model):
+    _name = "helpdesk.cron.run"
+    _description = "Helpdesk Scheduled Action Run"
+    _order = "start_date desc, id desc"
+
+    name = fields.Char(string="Job", required=True, readonly=True)
+    state = fields.Selection(
+        selection=[("done", "Done"), ("failed", "Failed")],
+        required=True,
+        default="done",
+        readonly=True,
+    )
+    start_date = fields.Datetime(required=True, readonly=True, index=True)
+    end_date = fields.Datetime(readonly=True)
+    duration = fields.Float(
+        string="Duration (s)",
+        compute="_compute_duration",
+        store=True,
+        group_operator="avg",
+    )
+    team_count = fields.Integer(string="Teams Processed", readonly=True)
+    ticket_scanned_count = fields.Integer(string="Tickets Scanned", readonly=True)
+    ticket_warned_count = fields.Integer(string="Tickets Warned", readonly=True)
+    ticket_closed_count = fields.Integer(string="Tickets Closed", readonly=True)
+    mail_count = fields.Integer(string="Mails Queued", readonly=True)
+    query_count = fields.Integer(string="SQL Queries", readonly=True)
+    memory_increase = fields.Float(
+        string="Memory Increase (MB)",
+        readonly=True,
+        group_operator="max",
+        help="Growth of the resident memory of the process running the job "
+        "between its start and its end. Jobs running at the same time in "
+        "the same process are included.",
+    )
+    error = fields.Text(readonly=True)
+
+    @api.depends("start_date", "end_date")
+    def _compute_duration(self):
+        for run in self:
+            if run.start_date and run.end_date:
+                run.duration = (run.end_date - run.start_date).total_seconds()
+            else:
+                run.duration = 0.0
+
+    @api.model
+    def _get_memory_usage(self):
+        """Return the resident memory of the current process in MB."""
+        return psutil.Process().memory_info().rss / 1024 / 1024
+
+    @api.model
+    @contextmanager
+    def _record(self, name):
+        """Record the telemetry of a helpdesk scheduled action run.
+
+        Usage::
+
+            with self.env["helpdesk.cron.run"]._record("Job") as stats:
+                stats["ticket_scanned_count"] += ...
+
+        The yielded dict accumulates the counters of the run; the start and
+        end dates, the SQL queries of the current cursor and the memory
+        growth of the process are filled in automatically. Queries made on
+        other cursors, like the ones of ``_run_per_team`` workers, are added
+        to ``query_count``. A failed run is recorded in a separate
+        transaction, outside of tests, before the error is raised again.
+        """
+        stats = dict.fromkeys(
+            [
+                "team_count",
+                "ticket_scanned_count",
+                "ticket_warned_count",
+                "ticket_closed_count",
+                "mail_count",
+                "query_count",
+            ],
+            0,
+        )
+        start_date = fields.Datetime.now()
+        start = (self.env.cr.sql_log_count, self._get_memory_usage())
+        try:
+            yield stats
+        except Exception as error:
+            if not getattr(threading.current_thread(), "testing", False):
+                values = self._prepare_run_values(name, stats, start_date, start)
+                values.update(state="failed", error=str(error))
+                with self.env.registry.cursor() as cr:
+                    self.with_env(self.env(cr=cr)).sudo().create(values)
+            raise
+        self.sudo().create(self._prepare_run_values(name, stats, start_date, start))
+
+    @api.model
+    def _prepare_run_values(self, name, stats, start_date, start):
+        """Return the values of a run record.
+
+        :param start: ``(query count, memory usage)`` at the start of the run
+        """
+        start_query_count, start_memory = start
+        return {
+            **stats,
+            "name": name,
+            "start_date": start_date,
+            "end_date": fields.Datetime.now(),
+            "query_count": stats["query_count"]
+            + self.env.cr.sql_log_count
+            - start_query_count,
+            "memory_increase": max(self._get_memory_usage() - start_memory, 0.0),
+        }
+
+    @api.autovacuum
+    def _gc_cron_runs(self):
+        retention_days = int(
+            self.env["ir.config_parameter"]
+            .sudo()
+            .get_param("helpdesk_mgmt.cron_run_retention_days", 30)
+        )
+        if retention_days <= 0:
+            return
+        limit_date = fields.Datetime.now() - timedelta(days=retention_days)
+        runs = self.sudo().search([("start_date", "<", limit_date)])
+        runs.unlink()
+        _logger.info("GC'd %d helpdesk scheduled action runs", len(runs))
@@ -1,5 +1,14 @@
+import re
+import time
+
 from odoo import _, api, fields, models, tools
 from odoo.exceptions import AccessError
+from odoo.tools.lru import LRU
+
+# Similar tickets suggested on the portal form, per database, customer and
+# searched words, kept for SIMILAR_TICKETS_TTL seconds
+SIMILAR_TICKETS_CACHE = LRU(4096)
+SIMILAR_TICKETS_TTL = 60
 
 
 class HelpdeskTicket(models.Model):
@@ -14,6 +23,7 @@ class HelpdeskTicket(models.Model):
         "mail.activity.mixin",
         "portal.mixin",
         "mail.tracking.duration.mixin",
+        "helpdesk.batch.mixin",
     ]
     _track_duration_field = "stage_id"
 
@@ -58,7 +68,7 @@ class HelpdeskTicket(models.Model):
         return stages.search(search_domain, order=order)
 
     number = fields.Char(string="Ticket number", default="/", readonly=True)
-    name = fields.Char(string="Title", required=True)
+    name = fields.Char(string="Title", required=True, index="trigram")
     description = fields.Html(required=True, sanitize_style=True)
     user_id = fields.Many2one(
         comodel_name="res.users",
@@ -154,6 +164,17 @@ class HelpdeskTicket(models.Model):
     )
     active = fields.Boolean(default=True)
 
+    def init(self):
+        super().init()
+        # Serves the agents pull queue (see helpdesk.ticket.team.pull_next_ticket)
+        tools.create_index(
+            self._cr,
+            "helpdesk_ticket_unassigned_queue_index",
+            self._table,
+            ["team_id", "priority DESC", "create_date", "id"],
+            where="user_id IS NULL AND active",
+        )
+
     @api.model
     def default_get(self, fields):
         # The appropriate user is defined only if the "Auto assign User" option is
@@ -247,8 +268,38 @@ class HelpdeskTicket(models.Model):
         return super().write(vals)
 
     def action_duplicate_tickets(self):
-        for ticket in self.browse(self.env.context["active_ids"]):
-            ticket.copy()
+        for tickets in self.browse(self.env.context["active_ids"])._iter_chunks():
+            for ticket in tickets:
+                ticket.copy()
+
+    @api.model
+    def _get_portal_similar_tickets(self, subject, limit=5):
+        """Return the tickets of the current customer similar to ``subject``.
+
+        Suggested while the customer types the subject of a new ticket, so
+        they can follow up an existing ticket instead of submitting it again:
+        up to ``limit`` open tickets and ``limit`` solved tickets whose title
+        contains all the words of ``subject``.
+        """
+        words = [word for word in re.findall(r"\w+", subject.lower()) if len(word) > 2]
+        if not words:
+            return self.browse()
+        partner = self.env.user.partner_id.commercial_partner_id
+        key = (self.env.cr.dbname, partner.id, limit, tuple(words[:5]))
+        cached = SIMILAR_TICKETS_CACHE.get(key)
+        if not cached or cached[0] <= time.monotonic() - SIMILAR_TICKETS_TTL:
+            # Shared by all the contacts of the customer: search regardless of
+            # the rules of the current user and filter the result below.
+            domain = [("partner_id", "child_of", partner.id)] + [
+                ("name", "ilike", word) for word in words[:5]
+            ]
+            tickets = self.sudo().search(
+                domain + [("closed", "=", False)], limit=limit, order="id desc"
+            ) | self.sudo().search(
+                domain + [("closed", "=", True)], limit=limit, order="id desc"
+            )
+            cached = SIMILAR_TICKETS_CACHE[key] = (time.monotonic(), tickets.ids)
+        return self.browse(cached[1]).exists()._filter_access_rules("read")
 
     def _prepare_ticket_number(self, values):
         seq = self.env["ir.sequence"]
@@ -1,6 +1,14 @@
-from odoo import api, fields, models
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from odoo import _, api, fields, models
+from odoo.tools import SQL
 from odoo.tools.safe_eval import safe_eval
 
+_logger = logging.getLogger(__name__)
+
 
 class HelpdeskTeam(models.Model):
     _name = "helpdesk.ticket.team"
@@ -132,6 +140,151 @@ class HelpdeskTeam(models.Model):
                 r[4] for r in result if r[0] == team.id and r[3] == "3"
             )
 
+    def pull_next_ticket(self):
+        """Atomically assign the next queued ticket to the current user.
+
+        The highest priority, oldest unassigned open ticket of the teams in
+        ``self`` (or of the user's teams if ``self`` is empty) that the user
+        can access is locked with ``FOR UPDATE SKIP LOCKED``, so concurrent
+        agents never pick the same ticket nor wait on each other, then
+        assigned through the regular ``write``.
+
+        :return: the claimed ``helpdesk.ticket``, empty if the queue is empty
+        """
+        teams = self or self.env.user.helpdesk_team_ids
+        ticket_model = self.env["helpdesk.ticket"]
+        if not teams:
+            return ticket_model
+        teams.check_access_rule("read")
+        ticket_model.check_access_rights("write")
+        query = ticket_model._search(
+            [
+                ("team_id", "in", teams.ids),
+                ("user_id", "=", False),
+                ("stage_id.closed", "=", False),
+            ],
+            order="priority desc, create_date, id",
+            limit=1,
+        )
+        self.env.cr.execute(
+            SQL(
+                "%s FOR UPDATE OF %s SKIP LOCKED",
+                query.select(),
+                SQL.identifier(ticket_model._table),
+            )
+        )
+        ticket = ticket_model.browse([row[0] for row in self.env.cr.fetchall()])
+        if ticket:
+            ticket.write({"user_id": self.env.uid})
+        return ticket
+
+    def action_pull_next_ticket(self):
+        ticket = self.pull_next_ticket()
+        if not ticket:
+            return {
+                "type": "ir.actions.client",
+                "tag": "display_notification",
+                "params": {
+                    "type": "info",
+                    "message": _("There are no unassigned tickets left."),
+                    "sticky": False,
+                },
+            }
+        return {
+            "type": "ir.actions.act_window",
+            "res_model": "helpdesk.ticket",
+            "res_id": ticket.id,
+            "view_mode": "form",
+            "target": "current",
+        }
+
+    def _get_cron_max_workers(self):
+        return max(
+            int(
+                self.env["ir.config_parameter"]
+                .sudo()
+                .get_param("helpdesk_mgmt.cron_max_workers", 1)
+            ),
+            1,
+        )
+
+    def _run_per_team(self, method_name, *args, max_workers=None, stats=None):
+        """Run ``method_name(*args)`` on every team of ``self``.
+
+        Each team is a work unit run in its own cursor and transaction, so
+        units only see the data committed before the call, and a failing
+        team is logged without stopping the others. With more than one
+        worker (see the ``helpdesk_mgmt.cron_max_workers`` parameter) the
+        units run concurrently, each in its own thread, the teams with the
+        most tickets being started first. In tests, the units run one after
+        the other in the current transaction, each in a savepoint.
+
+        :param stats: optional ``helpdesk.cron.run._record`` stats, the
+            queries made by the workers are added to its ``query_count``
+        :return: list of the results of the teams that succeeded
+        """
+        if max_workers is None:
+            max_workers = self._get_cron_max_workers()
+        max_workers = min(max_workers, len(self))
+        teams = self
+        if getattr(threading.current_thread(), "testing", False):
+            outcomes = [
+                partial(self._run_team_savepoint, team.id, method_name, args)
+                for team in teams
+            ]
+        elif max_workers <= 1:
+            outcomes = [
+                partial(self._run_team_job, team.id, method_name, args)
+                for team in teams
+            ]
+        else:
+            ticket_counts = dict(
+                self.env["helpdesk.ticket"]._read_group(
+                    [("team_id", "in", self.ids)], ["team_id"], ["__count"]
+                )
+            )
+            teams = self.sorted(lambda team: ticket_counts.get(team, 0), reverse=True)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                outcomes = [
+                    executor.submit(
+                        self._run_team_job, team.id, method_name, args
+                    ).result
+                    for team in teams
+                ]
+        results = []
+        for team, outcome in zip(teams, outcomes, strict=True):
+            try:
+                result, query_count = outcome()
+            except Exception:
+                _logger.exception(
+                    "Helpdesk job %s failed for team %s", method_name, team.name
+                )
+                continue
+            results.append(result)
+            if stats is not None:
+                stats["query_count"] += query_count
+        return results
+
+    def _run_team_savepoint(self, team_id, method_name, args):
+        """Run a work unit of ``_run_per_team`` in a savepoint of the current
+        transaction, its queries being made on the current cursor.
+        """
+        with self.env.cr.savepoint():
+            return getattr(self.browse(team_id), method_name)(*args), 0
+
+    def _run_team_job(self, team_id, method_name, args):
+        """Run a work unit of ``_run_per_team`` in a dedicated transaction.
+
+        :return: the result of the unit and the number of queries it made
+        """
+        thread = threading.current_thread()
+        thread.dbname = self.env.cr.dbname
+        thread.uid = self.env.uid
+        with self.env.registry.cursor() as cr:
+            env = api.Environment(cr, self.env.uid, self.env.context)
+            result = getattr(env[self._name].browse(team_id), method_name)(*args)
+            return result, cr.sql_log_count
+
     def _alias_get_creation_values(self):
         values = super()._alias_get_creation_values()
         values["alias_model_id"] = self.env.ref(
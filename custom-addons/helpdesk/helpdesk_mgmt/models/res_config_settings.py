@@ -22,3 +22,18 @@ class ResConfigSettings(models.TransientModel):
         related="company_id.helpdesk_mgmt_ticket_auto_assign",
         readonly=False,
     )
+    helpdesk_mgmt_cron_max_workers = fields.Integer(
+        string="Parallel Team Jobs",
+        config_parameter="helpdesk_mgmt.cron_max_workers",
+        default=1,
+        help="Number of teams processed concurrently by the helpdesk scheduled "
+        "actions, each in its own database transaction. Use 1 to process the "
+        "teams one after the other.",
+    )
+    helpdesk_mgmt_cron_run_retention_days = fields.Integer(
+        string="Scheduled Action Runs Retention (days)",
+        config_parameter="helpdesk_mgmt.cron_run_retention_days",
+        default=30,
+        help="Scheduled action runs older than this are deleted. "
+        "Use 0 to keep them forever.",
+    )
@@ -1,12 +1,53 @@
 // /** @odoo-module **/
 import {_t} from "@web/core/l10n/translation";
+import {debounce} from "@web/core/utils/timing";
 import {humanNumber} from "@web/core/utils/numbers";
+import {jsonrpc} from "@web/core/network/rpc_service";
 import publicWidget from "@web/legacy/js/public/public_widget";
 
 publicWidget.registry.NewTicket = publicWidget.Widget.extend({
     selector: "form[action='/submitted/ticket']",
     events: {
         'change input[name="attachment"]': "_onChangeAttachment",
+        'input input[name="subject"]': "_onInputSubject",
+    },
+    init() {
+        this._super(...arguments);
+        this._fetchSimilarTickets = debounce(this._fetchSimilarTickets, 300);
+        this._similarRequestId = 0;
+    },
+    _onInputSubject(ev) {
+        this._fetchSimilarTickets(ev.currentTarget.value);
+    },
+    async _fetchSimilarTickets(subject) {
+        const container = document.getElementById("similar_tickets");
+        // Only the response to the last typed subject is displayed
+        this._similarRequestId += 1;
+        const requestId = this._similarRequestId;
+        const tickets =
+            subject.trim().length > 2
+                ? await jsonrpc("/new/ticket/similar", {subject})
+                : [];
+        if (requestId !== this._similarRequestId) {
+            return;
+        }
+        const list = container.querySelector("ul");
+        list.replaceChildren(
+            ...tickets.map((ticket) => {
+                const item = document.createElement("li");
+                const link = document.createElement("a");
+                link.href = ticket.url;
+                link.textContent = `${ticket.number} - ${ticket.name}`;
+                const stage = document.createElement("span");
+                stage.className = ticket.closed
+                    ? "badge text-bg-success ms-2"
+                    : "badge text-bg-info ms-2";
+                stage.textContent = ticket.stage;
+                item.append(link, stage);
+                return item;
+            })
+        );
+        container.style.display = tickets.length ? "" : "none";
     },
     _onChangeAttachment(ev) {
         ev.preventDefault();
@@ -1,6 +1,8 @@
 # Copyright 2023 Tecnativa - Víctor Martínez
 # License AGPL-3 - See http://www.gnu.org/licenses/agpl-3.0.html
 # import odoo.tests
+import json
+
 from odoo import http
 from odoo.tests.common import new_test_user, tagged
 
@@ -87,6 +89,53 @@ class TestHelpdeskPortal(TestHelpdeskPortalBase):
             tickets.mapped("description"),
         )
 
+    def test_similar_tickets(self):
+        """Suggest the open and solved tickets of the customer."""
+        solved_ticket = self._create_ticket(
+            self.partner_portal,
+            "portal-ticket-title solved",
+            stage_id=self.env.ref("helpdesk_mgmt.helpdesk_ticket_stage_done").id,
+        )
+        other_ticket = self._create_ticket(
+            self.env["res.partner"].create({"name": "Other customer"}),
+            "portal-ticket-title other",
+        )
+        Ticket = self.env["helpdesk.ticket"].with_user(self.user_portal)
+        tickets = Ticket._get_portal_similar_tickets("Portal ticket")
+        self.assertEqual(tickets, self.portal_ticket | solved_ticket)
+        self.assertNotIn(other_ticket, tickets)
+        self.assertFalse(Ticket._get_portal_similar_tickets("portal printer"))
+        self.assertFalse(Ticket._get_portal_similar_tickets("a b"))
+        # The suggestions are shared by the contacts of the same customer
+        colleague = new_test_user(
+            self.env, login="test-portal-colleague", groups="base.group_portal"
+        )
+        colleague.parent_id = self.company.partner_id
+        self.assertEqual(
+            Ticket.with_user(colleague)._get_portal_similar_tickets("Portal ticket"),
+            tickets,
+        )
+        stranger = new_test_user(
+            self.env, login="test-portal-stranger", groups="base.group_portal"
+        )
+        self.assertFalse(
+            Ticket.with_user(stranger)._get_portal_similar_tickets("Portal ticket")
+        )
+        self.authenticate("portal", "portal")
+        resp = self.url_open(
+            "/new/ticket/similar",
+            data=json.dumps({"params": {"subject": "portal-ticket-tit"}}),
+            headers={"Content-Type": "application/json"},
+        )
+        self.assertEqual(resp.status_code, 200)
+        result = resp.json()["result"]
+        self.assertEqual(
+            [ticket["name"] for ticket in result],
+            ["portal-ticket-title", "portal-ticket-title solved"],
+        )
+        self.assertEqual(result[0]["url"], f"/my/ticket/{self.portal_ticket.id}")
+        self.assertTrue(result[1]["closed"])
+
     def test_ticket_list(self):
         """List tickets in portal mode, ensure it contains our test ticket."""
         self.authenticate("portal", "portal")
@@ -248,3 +248,28 @@ class TestHelpdeskTicket(TestHelpdeskTicketBase):
             new_ticket_form.stage_id = in_progress_stage
             new_ticket_form.user_id = self.user
         self.assertEqual(new_ticket_form.stage_id, in_progress_stage)
+
+    def test_iter_chunks(self):
+        tickets = self.env["helpdesk.ticket"].search([("team_id", "=", self.team_a.id)])
+        chunks = list(tickets._iter_chunks(size=2, fnames=["name"]))
+        self.assertEqual(len(chunks), -(-len(tickets) // 2))
+        self.assertEqual(sum(chunks, self.env["helpdesk.ticket"]), tickets)
+        for chunk in chunks:
+            self.assertEqual(set(chunk._prefetch_ids), set(chunk.ids))
+
+    def test_iter_chunks_invalidation(self):
+        tickets = self.env["helpdesk.ticket"].search([("team_id", "=", self.team_a.id)])
+        name_field = tickets._fields["name"]
+        team_name_field = self.team_a._fields["name"]
+        for chunk in tickets._iter_chunks(size=2, fnames=["name"]):
+            self.assertTrue(self.env.cache.contains(chunk[0], name_field))
+            chunk.team_id.fetch(["name"])
+        # Records read while processing the chunks are evicted as well
+        self.assertFalse(self.env.cache.contains(tickets[0], name_field))
+        self.assertFalse(self.env.cache.contains(self.team_a, team_name_field))
+
+    def test_action_duplicate_tickets(self):
+        tickets = self.ticket_a_unassigned | self.ticket_b_unassigned
+        count = self.env["helpdesk.ticket"].search_count([])
+        tickets.with_context(active_ids=tickets.ids).action_duplicate_tickets()
+        self.assertEqual(self.env["helpdesk.ticket"].search_count([]), count + 2)
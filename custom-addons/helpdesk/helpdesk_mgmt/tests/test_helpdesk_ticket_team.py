@@ -1,10 +1,39 @@
 # Copyright 2023 Tecnativa - Víctor Martínez
 # License AGPL-3 - See http://www.gnu.org/licenses/agpl-3.0.html
+import threading
+from concurrent.futures import Future
+from datetime import timedelta
+from unittest.mock import patch
+
+from odoo import fields
 from odoo.tests.common import users
 
+from odoo.addons.helpdesk_mgmt.models import helpdesk_ticket_team
+
 from .common import TestHelpdeskTicketBase
 
 
+class FakeExecutor:
+    """Run the submitted jobs synchronously, in submission order."""
+
+    def __init__(self, max_workers):
+        self.max_workers = max_workers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, fn, *args):
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as error:
+            future.set_exception(error)
+        return future
+
+
 class TestHelpdeskTicketTeam(TestHelpdeskTicketBase):
     @classmethod
     def setUpClass(cls):
@@ -100,3 +129,110 @@ class TestHelpdeskTicketTeam(TestHelpdeskTicketBase):
             2,
             "Helpdesk Ticket: Helpdesk ticket team should have two ticket to do.",
         )
+
+    @users("helpdesk_mgmt-user")
+    def test_pull_next_ticket(self):
+        team = self.team_a.with_user(self.env.user)
+        oldest = self._create_ticket(self.team_a)
+        newest = self._create_ticket(self.team_a)
+        # Highest priority first
+        ticket = team.pull_next_ticket()
+        self.assertEqual(ticket, self.ticket_a_unassigned)
+        self.assertEqual(ticket.user_id, self.env.user)
+        self.assertTrue(ticket.assigned_date)
+        self.assertIn(self.env.user.partner_id, ticket.message_partner_ids)
+        # The assignment is tracked like any other one
+        self.env.flush_all()
+        self.env.cr.precommit.run()
+        self.assertEqual(
+            ticket.message_ids[0].tracking_value_ids.field_id.name, "user_id"
+        )
+        # Then the oldest one
+        self.assertEqual(team.pull_next_ticket(), oldest)
+        self.assertEqual(team.pull_next_ticket(), newest)
+        self.assertFalse(team.pull_next_ticket())
+        action = team.action_pull_next_ticket()
+        self.assertEqual(action["tag"], "display_notification")
+
+    @users("helpdesk_mgmt-user_team")
+    def test_pull_next_ticket_user_teams(self):
+        ticket = self.env["helpdesk.ticket.team"].pull_next_ticket()
+        self.assertEqual(ticket, self.ticket_b_unassigned)
+        self.assertEqual(ticket.user_id, self.env.user)
+
+    def test_run_per_team(self):
+        teams = self.team_a | self.team_b
+        self.assertEqual(
+            teams._run_per_team("mapped", "name", max_workers=4),
+            [["Team A"], ["Team B"]],
+        )
+
+    def test_run_per_team_failure(self):
+        teams = self.team_a | self.team_b
+
+        def rename(team, name):
+            team.name = name
+            if team == self.team_a:
+                raise ValueError("Team failure")
+            return team.name
+
+        with (
+            patch.object(type(self.Model), "_test_rename", rename, create=True),
+            self.assertLogs(helpdesk_ticket_team._logger, "ERROR"),
+        ):
+            results = teams._run_per_team("_test_rename", "Renamed", max_workers=1)
+        # The failing team is rolled back, the other ones still run
+        self.assertEqual(results, ["Renamed"])
+        self.assertEqual(self.team_a.name, "Team A")
+        self.assertEqual(self.team_b.name, "Renamed")
+
+    def test_run_per_team_threaded(self):
+        teams = self.team_a | self.team_b
+        ticket_counts = {
+            team: self.env["helpdesk.ticket"].search_count([("team_id", "=", team.id)])
+            for team in teams
+        }
+        first, last = sorted(teams, key=ticket_counts.get, reverse=True)
+        started = []
+
+        def run_team_job(team_model, team_id, method_name, args):
+            started.append(team_id)
+            if team_id == first.id:
+                raise ValueError("Team failure")
+            team = team_model.browse(team_id)
+            return getattr(team, method_name)(*args), 3
+
+        cron_run_model = self.env["helpdesk.cron.run"]
+        thread = threading.current_thread()
+        with (
+            patch.object(thread, "testing", False),
+            patch.object(helpdesk_ticket_team, "ThreadPoolExecutor", FakeExecutor),
+            patch.object(type(self.Model), "_run_team_job", run_team_job),
+            self.assertLogs(helpdesk_ticket_team._logger, "ERROR"),
+            cron_run_model._record("Threaded Job") as stats,
+        ):
+            results = teams._run_per_team("mapped", "name", max_workers=2, stats=stats)
+        # Biggest teams first, a failing team does not stop the others
+        self.assertEqual(started, [first.id, last.id])
+        self.assertEqual(results, [[last.name]])
+        self.assertEqual(stats["query_count"], 3)
+        run = cron_run_model.search([("name", "=", "Threaded Job")])
+        self.assertGreaterEqual(run.query_count, 3)
+
+    def test_cron_run_record_and_gc(self):
+        cron_run_model = self.env["helpdesk.cron.run"]
+        with (
+            patch.object(
+                type(cron_run_model), "_get_memory_usage", side_effect=[100.0, 112.5]
+            ),
+            cron_run_model._record("Test Job") as stats,
+        ):
+            stats["team_count"] += 2
+            self.team_a.read(["name"])
+        run = cron_run_model.search([("name", "=", "Test Job")])
+        self.assertEqual(run.team_count, 2)
+        self.assertEqual(run.memory_increase, 12.5)
+        self.assertEqual(run.state, "done")
+        run.start_date = fields.Datetime.now() - timedelta(days=31)
+        cron_run_model._gc_cron_runs()
+        self.assertFalse(run.exists())
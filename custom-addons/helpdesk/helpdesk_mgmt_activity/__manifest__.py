@@ -4,7 +4,7 @@
 {
     "name": "Helpdesk Management Activity",
     "summary": "Create Activities for Odoo records from the Helpdesk",
-    "version": "17.0.1.0.0",
+    "version": "17.0.1.0.2",
     "license": "AGPL-3",
     "author": "Cetmix OÜ, Odoo Community Association (OCA)",
     "website": "https://github.com/OCA/helpdesk",
@@ -4,4 +4,5 @@
 from . import res_config_settings
 from . import helpdesk_ticket
 from . import helpdesk_ticket_team
+from . import helpdesk_ticket_stage
 from . import mail_activity
@@ -2,8 +2,9 @@
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
 
 import ast
+from bisect import bisect_right
 
-from odoo import _, api, fields, models
+from odoo import _, api, fields, models, tools
 
 
 class HelpdeskTicket(models.Model):
@@ -33,8 +34,13 @@ class HelpdeskTicket(models.Model):
     is_new_stage = fields.Boolean(compute="_compute_is_new_stage")
 
     @api.model
-    def _selection_record_ref(self):
-        """Select target model for source document"""
+    @tools.ormcache("self.env.lang")
+    def _get_available_models(self):
+        """Return the ``(model, name)`` of the models set in the settings.
+
+        Changing the setting writes the ``ir.config_parameter``, which clears
+        this cache.
+        """
         model_ids_str = (
             self.env["ir.config_parameter"]
             .sudo()
@@ -42,60 +48,76 @@ class HelpdeskTicket(models.Model):
         )
         model_ids = ast.literal_eval(model_ids_str)
         if not model_ids:
-            return []
-        IrModelAccess = self.env["ir.model.access"].with_user(self.env.user.id)
-        available_models = self.env["ir.model"].search_read(
-            [("id", "in", model_ids)], fields=["model", "name"]
+            return ()
+        return tuple(
+            (model.model, model.name)
+            for model in self.env["ir.model"].sudo().search([("id", "in", model_ids)])
         )
+
+    @api.model
+    def _selection_record_ref(self):
+        """Select target model for source document"""
+        IrModelAccess = self.env["ir.model.access"].with_user(self.env.user.id)
         return [
-            (model.get("model"), model.get("name"))
-            for model in available_models
-            if IrModelAccess.check(model.get("model"), "read", False)
+            (model, name)
+            for model, name in self._get_available_models()
+            if IrModelAccess.check(model, "read", False)
         ]
 
     @api.model
-    def _get_team_stages(self, teams):
-        """
-        Get grouping stages by team id
+    @tools.ormcache("team_id", "company_id")
+    def _get_team_stage_order(self, team_id, company_id):
+        """Return the ids and sequences of the applicable stages of a team.
 
-        :param teams: helpdesk.ticket.team record set
-        :return: dict {team_id: team stages recordset}
+        :param team_id: id of the team, ``False`` for tickets without team
+        :param company_id: company of the tickets without team
+        :return: tuple ``(stage_ids, sequences)`` in the order of the stages
         """
-        return {team.id: team._get_applicable_stages() for team in teams}
+        team = self.env["helpdesk.ticket.team"].sudo().browse(team_id)
+        stages = team.with_company(company_id)._get_applicable_stages()
+        return tuple(stages.ids), tuple(stages.mapped("sequence"))
+
+    def _get_stage_order(self):
+        self.ensure_one()
+        company_id = False if self.team_id else self.env.company.id
+        return self._get_team_stage_order(self.team_id.id, company_id)
 
     def _compute_is_new_stage(self):
         for ticket in self:
-            new_stage = ticket.team_id._get_applicable_stages()[:1]
-            ticket.is_new_stage = ticket.stage_id == new_stage
+            stage_ids, _sequences = ticket._get_stage_order()
+            first_stage_id = stage_ids[0] if stage_ids else False
+            ticket.is_new_stage = ticket.stage_id.id == first_stage_id
 
     @api.depends("stage_id")
     def _compute_next_stage_id(self):
         """Compute next stage for ticket"""
-        team_stages = self._get_team_stages(self.team_id)
-        helpdesk_ticket_stage_obj = self.env["helpdesk.ticket.stage"]
         for record in self:
-            current_stage = record.stage_id
-            stages = team_stages.get(record.team_id.id, helpdesk_ticket_stage_obj)
-            next_stage = (
-                stages.filtered(
-                    lambda stage, _cur_stage=current_stage: stage.sequence
-                    > _cur_stage.sequence
-                )[:1]
-                or current_stage
+            stage_ids, sequences = record._get_stage_order()
+            # First stage with a greater sequence than the current one
+            index = bisect_right(sequences, record.stage_id.sequence)
+            record.next_stage_id = (
+                stage_ids[index] if index < len(stage_ids) else record.stage_id
             )
-            record.next_stage_id = next_stage
 
     @api.depends("res_model", "res_id")
     def _compute_record_ref(self):
         """Compute Source Document Reference"""
-        for rec in self:
-            if not rec.res_model or not rec.res_id:
-                rec.record_ref = None
+        # Access is checked once per source model for all the tickets
+        readable_refs = set()
+        for res_model, tickets in self.grouped("res_model").items():
+            if not res_model or res_model not in self.env:
+                continue
+            records = self.env[res_model].browse(set(tickets.mapped("res_id")) - {0})
+            if not records.check_access_rights("read", raise_exception=False):
                 continue
-            try:
-                self.env[rec.res_model].browse(rec.res_id).check_access_rule("read")
+            readable_refs.update(
+                (res_model, record.id)
+                for record in records.exists()._filter_access_rules("read")
+            )
+        for rec in self:
+            if (rec.res_model, rec.res_id) in readable_refs:
                 rec.record_ref = f"{rec.res_model},{rec.res_id}"
-            except Exception:
+            else:
                 rec.record_ref = None
 
     def _inverse_record_ref(self):
@@ -17,3 +17,10 @@ class HelpdeskTicketTeam(models.Model):
         domain="['|', ('team_ids', 'in, []'), ('team_ids', 'in', [id])]",
         help="Move the ticket when the activity in source record is done",
     )
+
+    def write(self, vals):
+        res = super().write(vals)
+        if "company_id" in vals:
+            # The applicable stages depend on the company of the team
+            self.env.registry.clear_cache()
+        return res
@@ -82,6 +82,21 @@ class TestHelpdeskTicket(TestHelpdeskTicketBase):
             ticket.stage_id, self.stage_closed, "Ticket stage must be closed"
         )
 
+    def test_ticket_stage_order(self):
+        """Test next and new stages follow the order of the stages"""
+        ticket_1 = self._create_ticket(self.team_a, self.user)
+        ticket_2 = self._create_ticket(self.team_a, self.user)
+        tickets = ticket_1 | ticket_2
+        tickets[1].stage_id = self.progress_stage
+        self.assertEqual(tickets.mapped("is_new_stage"), [True, False])
+        self.assertEqual(tickets[0].next_stage_id, self.progress_stage)
+        # Move the progress stage before the new stage
+        self.progress_stage.sequence = self.new_stage.sequence - 1
+        tickets.invalidate_recordset(["is_new_stage"])
+        self.assertEqual(tickets.mapped("is_new_stage"), [False, True])
+        tickets[1].stage_id = self.new_stage
+        self.assertNotEqual(tickets[1].next_stage_id, self.progress_stage)
+
     def test_ticket_available_model_ids(self):
         """Test flow when available model for ticket is updated"""
         settings = self.env["res.config.settings"].create({})
@@ -125,6 +140,36 @@ class TestHelpdeskTicket(TestHelpdeskTicketBase):
         self.assertFalse(ticket.res_id, "Res ID must be False")
         self.assertFalse(ticket.res_model, "Res Model must be False")
 
+    def test_ticket_record_ref_batch(self):
+        """Test source records computed for several tickets at once"""
+        partner_2 = self.env["res.partner"].create({"name": "Test Partner 2"})
+        tickets = self._create_ticket(self.team_a, self.user)
+        for partner in (self.test_partner, partner_2, partner_2):
+            tickets |= self._create_ticket(self.team_a, self.user)
+            tickets[-1:].write({"res_model": "res.partner", "res_id": partner.id})
+        partner_2.unlink()
+        tickets.invalidate_recordset(["record_ref"])
+        self.assertEqual(
+            [bool(ticket.record_ref) for ticket in tickets], [False, True, False, False]
+        )
+        self.assertEqual(tickets[1].record_ref, self.test_partner)
+
+    def test_ticket_available_models_cache(self):
+        """Test available models follow the settings"""
+        Ticket = self.env["helpdesk.ticket"]
+        self.assertEqual(
+            Ticket._selection_record_ref(), [("res.partner", self.partner_model.name)]
+        )
+        user_model = self.env["ir.model"]._get("res.users")
+        settings = self.env["res.config.settings"].create({})
+        with Form(settings) as form:
+            form.helpdesk_available_model_ids.add(user_model)
+        settings.execute()
+        self.assertEqual(
+            [model for model, _name in Ticket._selection_record_ref()],
+            ["res.partner", "res.users"],
+        )
+
     def test_perform_action(self):
         """Test flow when create action in record reference"""
         ticket = self._create_ticket(self.team_a, self.user)
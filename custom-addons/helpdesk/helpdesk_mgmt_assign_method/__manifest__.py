@@ -5,7 +5,7 @@
     "name": "Helpdesk Mgmt Assign Method",
     "summary": """
         Helpdesk Assign Method""",
-    "version": "17.0.1.0.0",
+    "version": "17.0.1.1.2",
     "license": "AGPL-3",
     "author": "Escodoo,Odoo Community Association (OCA)",
     "website": "https://github.com/OCA/helpdesk",
@@ -13,6 +13,7 @@
         "helpdesk_mgmt",
     ],
     "data": [
+        "security/ir.model.access.csv",
         "views/helpdesk_ticket_team.xml",
     ],
 }
@@ -18,14 +18,14 @@ class HelpdeskTicket(models.Model):
         if (not fields_list or "user_id" in fields_list) and "user_id" not in res:
             team = self.env["helpdesk.ticket.team"].browse(team_id)
             if team.assign_method != "manual":
-                res["user_id"] = team.get_new_user().id
+                res["user_id"] = team.get_new_user(res.get("category_id")).id
         return res
 
     @api.onchange("team_id")
     def _onchange_team_id(self):
         """Assign user when team changes if not already set."""
         if self.team_id and not self.user_id:
-            self.user_id = self.team_id.get_new_user()
+            self.user_id = self.team_id.get_new_user(self.category_id)
 
     @api.model
     def create(self, vals):
@@ -39,8 +39,23 @@ class HelpdeskTicket(models.Model):
                     if team.assign_method == "manual":
                         vals["user_id"] = False
                     else:
-                        vals["user_id"] = team.get_new_user().id
+                        vals["user_id"] = team.get_new_user(
+                            vals.get("category_id")
+                        ).id
             else:
                 if team.assign_method != "manual":
-                    vals["user_id"] = team.get_new_user().id
-        return super().create(vals)
+                    vals["user_id"] = team.get_new_user(vals.get("category_id")).id
+        ticket = super().create(vals)
+        if ticket.user_id and not ticket.closed:
+            self.env["helpdesk.ticket.team"]._add_assignment_load(ticket.user_id.id)
+        return ticket
+
+    def write(self, vals):
+        if {"user_id", "stage_id", "active"}.intersection(vals):
+            self.env["helpdesk.ticket.team"]._invalidate_assignment_loads()
+        return super().write(vals)
+
+    def unlink(self):
+        if self.user_id:
+            self.env["helpdesk.ticket.team"]._invalidate_assignment_loads()
+        return super().unlink()
@@ -4,11 +4,14 @@
 
 import logging
 
-from odoo import _, api, fields, models
+from odoo import _, api, fields, models, tools
 from odoo.exceptions import ValidationError
 
 _logger = logging.getLogger(__name__)
 
+# Key of the per-transaction open ticket counts in ``cr.precommit.data``
+ASSIGNMENT_LOADS_KEY = "helpdesk_mgmt_assign_method.loads"
+
 
 class HelpdeskTicketTeam(models.Model):
     _inherit = "helpdesk.ticket.team"
@@ -19,6 +22,7 @@ class HelpdeskTicketTeam(models.Model):
             ("randomly", "Randomly"),
             ("balanced", "Balanced"),
             ("sequential", "Sequential"),
+            ("weighted", "Capacity and Skill Weighted"),
         ],
         string="Assignation Method",
         default="manual",
@@ -28,9 +32,21 @@ class HelpdeskTicketTeam(models.Model):
             "Manually: manual\n"
             "Randomly: randomly but everyone gets the same amount\n"
             "Balanced: to the person with the least amount of open tickets\n"
-            "Sequential: ensuring an even distribution among team members"
+            "Sequential: ensuring an even distribution among team members\n"
+            "Capacity and Skill Weighted: to the member with the best skill "
+            "for the ticket category and the most free capacity"
         ),
     )
+    capacity_ids = fields.One2many(
+        comodel_name="helpdesk.ticket.team.capacity",
+        inverse_name="team_id",
+        string="Member Capacities",
+    )
+
+    def unlink(self):
+        res = super().unlink()
+        self.env.registry.clear_cache()
+        return res
 
     @api.onchange("user_ids")
     def _onchange_user_ids(self):
@@ -50,8 +66,12 @@ class HelpdeskTicketTeam(models.Model):
                     )
                 )
 
-    def get_new_user(self):
-        """Return the next user for ticket assignment based on assign_method."""
+    def get_new_user(self, category=None):
+        """Return the next user for ticket assignment based on assign_method.
+
+        :param category: optional ``helpdesk.ticket.category`` record or id of
+            the ticket to assign, used by the weighted method.
+        """
         self.ensure_one()
         user_ids = sorted(self.user_ids.ids)
         if not user_ids or self.assign_method == "manual":
@@ -63,6 +83,8 @@ class HelpdeskTicketTeam(models.Model):
             return self._assign_balanced(user_ids)
         if self.assign_method == "sequential":
             return self._assign_sequential(user_ids)
+        if self.assign_method == "weighted":
+            return self._assign_weighted(user_ids, category)
         return self.env["res.users"]
 
     def _assign_randomly(self, user_ids):
@@ -116,3 +138,107 @@ class HelpdeskTicketTeam(models.Model):
         next_user = self.env["res.users"].browse(user_ids[next_index])
         _logger.info("Next assigned user ID: %s", next_user.id)
         return next_user
+
+    @api.model
+    @tools.ormcache("team_id", "user_ids")
+    def _get_assignment_matrix(self, team_id, user_ids):
+        """Return the precomputed assignment matrix of a team.
+
+        The matrix is a tuple ``(user_ids, max_loads, weights)`` where
+        ``user_ids`` is the sorted tuple of the current team members,
+        ``max_loads`` is aligned with ``user_ids`` (0 meaning unlimited) and
+        ``weights`` maps a category id to the weights aligned with
+        ``user_ids``. Members without a skill for a category get a neutral
+        weight of 1.0. The cache is keyed on the members, so it follows
+        membership changes made from the team or the user side as well as
+        user archiving, and it is cleared when capacities change.
+        """
+        team = self.sudo().browse(team_id)
+        position = {user_id: index for index, user_id in enumerate(user_ids)}
+        max_loads = [0] * len(user_ids)
+        weights = {}
+        for capacity in team.capacity_ids:
+            index = position.get(capacity.user_id.id)
+            if index is None:
+                continue
+            max_loads[index] = capacity.max_load
+            for skill in capacity.skill_ids:
+                category_weights = weights.setdefault(
+                    skill.category_id.id, [1.0] * len(user_ids)
+                )
+                category_weights[index] = skill.weight
+        return (
+            user_ids,
+            tuple(max_loads),
+            {category_id: tuple(row) for category_id, row in weights.items()},
+        )
+
+    @api.model
+    def _get_assignment_loads(self, user_ids):
+        """Return the open ticket count of the given users.
+
+        Counts are fetched once per transaction and kept up to date in memory
+        while tickets are assigned, so creating tickets in bulk does not
+        recount every open ticket for each of them.
+        """
+        loads = self.env.cr.precommit.data.setdefault(ASSIGNMENT_LOADS_KEY, {})
+        missing = tuple(user_id for user_id in user_ids if user_id not in loads)
+        if missing:
+            self.env["helpdesk.ticket"].flush_model(["user_id", "stage_id", "active"])
+            self.env.cr.execute(
+                """
+                SELECT ticket.user_id, COUNT(*)
+                FROM helpdesk_ticket ticket
+                JOIN helpdesk_ticket_stage stage ON stage.id = ticket.stage_id
+                WHERE ticket.user_id IN %s
+                    AND ticket.active
+                    AND stage.closed IS NOT TRUE
+                GROUP BY ticket.user_id
+                """,
+                (missing,),
+            )
+            loads.update(dict.fromkeys(missing, 0))
+            loads.update(self.env.cr.fetchall())
+        return loads
+
+    @api.model
+    def _add_assignment_load(self, user_id):
+        """Account a new open ticket for ``user_id`` in the cached loads."""
+        loads = self.env.cr.precommit.data.get(ASSIGNMENT_LOADS_KEY)
+        if loads is not None and user_id in loads:
+            loads[user_id] += 1
+
+    @api.model
+    def _invalidate_assignment_loads(self):
+        self.env.cr.precommit.data.pop(ASSIGNMENT_LOADS_KEY, None)
+
+    def _assign_weighted(self, user_ids, category=None):
+        """Assign ticket to the member with the best skill and free capacity.
+
+        Each member gets the score ``weight * free`` where ``weight`` is the
+        member skill for the ticket category and ``free`` the share of its
+        capacity still available (``1 / (1 + load)`` without a maximum).
+        Members at full capacity or with a 0 weight are skipped; when nobody
+        is available the ticket is left unassigned.
+        """
+        user_ids, max_loads, weights = self._get_assignment_matrix(
+            self.id, tuple(user_ids)
+        )
+        if isinstance(category, models.BaseModel):
+            category = category.id
+        category_weights = weights.get(category) or (1.0,) * len(user_ids)
+        loads = self._get_assignment_loads(user_ids)
+        best_key = best_user_id = None
+        for user_id, max_load, weight in zip(
+            user_ids, max_loads, category_weights, strict=True
+        ):
+            load = loads[user_id]
+            if not weight or (max_load and load >= max_load):
+                continue
+            free = (max_load - load) / max_load if max_load else 1 / (1 + load)
+            key = (weight * free, -load, -user_id)
+            if best_key is None or key > best_key:
+                best_key, best_user_id = key, user_id
+        if best_user_id is None:
+            return self.env["res.users"]
+        return self.env["res.users"].browse(best_user_id)
@@ -0,0 +1,119 @@
+# Copyright 2025 - TODAY, Kaynnan Lemes <kaynnan.lemes@escodoo.com.br>
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+
+from odoo import api, fields, models
+
+
+class HelpdeskTicketTeamCapacity(models.Model):
+    _name = "helpdesk.ticket.team.capacity"
+    _description = "Helpdesk Team Member Capacity"
+    _order = "team_id, user_id"
+
+    team_id = fields.Many2one(
+        comodel_name="helpdesk.ticket.team",
+        required=True,
+        ondelete="cascade",
+        index=True,
+    )
+    user_id = fields.Many2one(
+        comodel_name="res.users",
+        string="Member",
+        required=True,
+        ondelete="cascade",
+        domain="[('id', 'in', team_user_ids)]",
+    )
+    team_user_ids = fields.Many2many(
+        comodel_name="res.users", related="team_id.user_ids"
+    )
+    max_load = fields.Integer(
+        string="Maximum Open Tickets",
+        help="Maximum number of open tickets this member can hold. "
+        "Leave 0 for no limit.",
+    )
+    skill_ids = fields.One2many(
+        comodel_name="helpdesk.ticket.team.skill",
+        inverse_name="capacity_id",
+        string="Category Skills",
+    )
+
+    _sql_constraints = [
+        (
+            "team_user_uniq",
+            "unique(team_id, user_id)",
+            "A member can only have one capacity line per team.",
+        ),
+        (
+            "max_load_positive",
+            "CHECK(max_load >= 0)",
+            "The maximum open tickets cannot be negative.",
+        ),
+    ]
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env.registry.clear_cache()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        self.env.registry.clear_cache()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env.registry.clear_cache()
+        return res
+
+
+class HelpdeskTicketTeamSkill(models.Model):
+    _name = "helpdesk.ticket.team.skill"
+    _description = "Helpdesk Team Member Category Skill"
+    _order = "capacity_id, category_id"
+
+    capacity_id = fields.Many2one(
+        comodel_name="helpdesk.ticket.team.capacity",
+        required=True,
+        ondelete="cascade",
+        index=True,
+    )
+    category_id = fields.Many2one(
+        comodel_name="helpdesk.ticket.category",
+        required=True,
+        ondelete="cascade",
+    )
+    weight = fields.Float(
+        default=1.0,
+        help="Preference of this member for tickets of the category. "
+        "Members with a higher weight are chosen first, a weight of 0 "
+        "excludes the member from the category.",
+    )
+
+    _sql_constraints = [
+        (
+            "capacity_category_uniq",
+            "unique(capacity_id, category_id)",
+            "A category can only be weighted once per member.",
+        ),
+        (
+            "weight_positive",
+            "CHECK(weight >= 0)",
+            "The skill weight cannot be negative.",
+        ),
+    ]
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env.registry.clear_cache()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        self.env.registry.clear_cache()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env.registry.clear_cache()
+        return res
@@ -173,3 +173,94 @@ class TestHelpdeskTicketAssign(TransactionCase):
         ticket = self.env["helpdesk.ticket"].create(vals)
         self.assertFalse(ticket.team_id)
         self.assertNotIn(ticket.user_id, self.team.user_ids)
+
+    def _set_capacity(self, user, max_load=0, skills=None):
+        return self.env["helpdesk.ticket.team.capacity"].create(
+            {
+                "team_id": self.team.id,
+                "user_id": user.id,
+                "max_load": max_load,
+                "skill_ids": [
+                    Command.create({"category_id": category.id, "weight": weight})
+                    for category, weight in (skills or {}).items()
+                ],
+            }
+        )
+
+    def test_get_new_user_weighted_capacity(self):
+        self.team.assign_method = "weighted"
+        self._set_capacity(self.user1, max_load=2)
+        self._set_capacity(self.user2, max_load=2)
+        self._set_capacity(self.user3, max_load=4)
+        self._create_ticket(user_id=self.user1.id)
+        self._create_ticket(user_id=self.user2.id)
+        self._create_ticket(user_id=self.user3.id)
+        # user3 still has 3/4 of its capacity free, more than anybody else
+        self.assertEqual(self.team.get_new_user(), self.user3)
+        self._create_ticket(user_id=self.user1.id)
+        self._create_ticket(user_id=self.user2.id)
+        for _i in range(3):
+            self._create_ticket(user_id=self.user3.id)
+        # Everybody is at full capacity
+        self.assertFalse(self.team.get_new_user())
+
+    def test_get_new_user_weighted_skill(self):
+        self.team.assign_method = "weighted"
+        category = self.env["helpdesk.ticket.category"].create({"name": "Billing"})
+        self._set_capacity(self.user1, skills={category: 0.0})
+        self._set_capacity(self.user2, skills={category: 3.0})
+        self._create_ticket(user_id=self.user2.id)
+        self.assertEqual(self.team.get_new_user(category), self.user2)
+        ticket = self._create_ticket(category_id=category.id)
+        self.assertEqual(ticket.user_id, self.user2)
+        # Without category the least loaded member wins
+        self.assertIn(self.team.get_new_user(), self.user1 | self.user3)
+
+    def _get_assignment_matrix(self):
+        return self.team._get_assignment_matrix(
+            self.team.id, tuple(sorted(self.team.user_ids.ids))
+        )
+
+    def test_weighted_matrix_refreshed_on_membership_change(self):
+        self.team.assign_method = "weighted"
+        user_ids, max_loads, _weights = self._get_assignment_matrix()
+        self.assertEqual(set(user_ids), set(self.team.user_ids.ids))
+        self.assertEqual(max_loads, (0, 0, 0))
+        self.team.user_ids = [Command.unlink(self.user3.id)]
+        user_ids, _max_loads, _weights = self._get_assignment_matrix()
+        self.assertNotIn(self.user3.id, user_ids)
+        self._set_capacity(self.user1, max_load=5)
+        _user_ids, max_loads, _weights = self._get_assignment_matrix()
+        self.assertIn(5, max_loads)
+        # Membership changed from the user side
+        self.user3.helpdesk_team_ids = [Command.link(self.team.id)]
+        user_ids, _max_loads, _weights = self._get_assignment_matrix()
+        self.assertIn(self.user3.id, user_ids)
+        # Archived users are no longer members
+        self.user2.active = False
+        self.env.invalidate_all()
+        user_ids, _max_loads, _weights = self._get_assignment_matrix()
+        self.assertNotIn(self.user2.id, user_ids)
+        self.assertNotEqual(self.team.get_new_user(), self.user2)
+
+    def test_weighted_loads_refreshed_on_pull(self):
+        ticket = self._create_ticket()
+        self.assertFalse(ticket.user_id)
+        self.team.assign_method = "weighted"
+        self._set_capacity(self.user1, max_load=1)
+        # user1 wins ties, having the lowest id, and its load gets cached
+        self.assertEqual(self.team.get_new_user(), self.user1)
+        team = self.team.with_user(self.user1).sudo()
+        self.assertEqual(team.pull_next_ticket(), ticket)
+        self.assertEqual(ticket.user_id, self.user1)
+        # The cached loads account for the pulled ticket
+        self.assertNotEqual(self.team.get_new_user(), self.user1)
+
+    def test_weighted_loads_refreshed_on_unlink(self):
+        self.team.assign_method = "weighted"
+        self._set_capacity(self.user1, max_load=1)
+        ticket = self._create_ticket(user_id=self.user1.id)
+        # user1 is at full capacity and its load is cached
+        self.assertNotEqual(self.team.get_new_user(), self.user1)
+        ticket.unlink()
+        self.assertEqual(self.team.get_new_user(), self.user1)
@@ -75,3 +75,34 @@ class TestHelpdeskMgmtCrm(common.TransactionCase):
         res = self.ticket.action_open_leads()
         self.assertEqual(res["res_model"], self.ticket.lead_ids._name)
         self.assertEqual(res["res_id"], self.ticket.lead_ids.id)
+
+    @users("sale-user")
+    def test_action_lead_create_multi(self):
+        tickets = self.ticket | self.ticket.copy({"name": "Test ticket 2"})
+        tickets.message_subscribe(
+            partner_ids=self.partner.ids,
+            subtype_ids=[self.env.ref("mail.mt_comment").id],
+        )
+        for ticket in tickets:
+            # pylint: disable=translation-required
+            ticket.message_post(body=ticket.name, subtype_xmlid="mail.mt_comment")
+        messages_count = {ticket: len(ticket.message_ids) for ticket in tickets}
+        wizard = (
+            self.env["helpdesk.ticket.create.lead"]
+            .with_context(active_model="helpdesk.ticket", active_ids=tickets.ids)
+            .create({"team_id": self.team.id})
+        )
+        self.assertFalse(wizard.ticket_id)
+        self.assertEqual(wizard.ticket_ids, tickets)
+        res = wizard.action_helpdesk_ticket_to_lead()
+        leads = tickets.lead_ids
+        self.assertEqual(len(leads), 2)
+        self.assertEqual(sorted(res["domain"][0][2]), sorted(leads.ids))
+        tickets.invalidate_recordset(["message_ids"])
+        for ticket in tickets:
+            lead = ticket.lead_ids
+            self.assertEqual(lead.name, ticket.name)
+            self.assertGreaterEqual(len(lead.message_ids), messages_count[ticket])
+            self.assertIn(f"<p>{ticket.name}</p>", lead.message_ids.mapped("body"))
+            self.assertIn(self.partner, lead.message_follower_ids.partner_id)
+            self.assertEqual(len(ticket.message_ids), messages_count[ticket] + 1)
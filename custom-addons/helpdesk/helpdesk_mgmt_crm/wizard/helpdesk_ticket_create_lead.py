@@ -1,6 +1,8 @@
 # Copyright 2022-2025 Tecnativa - Víctor Martínez
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
 
+from collections import defaultdict
+
 from markupsafe import Markup
 
 from odoo import SUPERUSER_ID, _, api, fields, models
@@ -12,53 +14,122 @@ class HelpdeskTicketCreateLead(models.TransientModel):
 
     ticket_id = fields.Many2one(
         comodel_name="helpdesk.ticket",
-        required=True,
         readonly=True,
         domain=[("lead_id", "=", False)],
     )
+    ticket_ids = fields.Many2many(
+        comodel_name="helpdesk.ticket",
+        string="Tickets",
+        readonly=True,
+    )
     user_id = fields.Many2one(comodel_name="res.users")
     team_id = fields.Many2one(comodel_name="crm.team")
 
     @api.model
     def default_get(self, fields):
         vals = super().default_get(fields)
-        ticket = self.env["helpdesk.ticket"].browse([self.env.context.get("active_id")])
-        if ticket:
-            vals.update({"ticket_id": ticket.id})
+        context = self.env.context
+        if context.get("active_model", "helpdesk.ticket") != "helpdesk.ticket":
+            return vals
+        ticket_ids = context.get("active_ids") or (
+            [context["active_id"]] if context.get("active_id") else []
+        )
+        if ticket_ids:
+            vals.update({"ticket_ids": [(6, 0, ticket_ids)]})
+            if len(ticket_ids) == 1:
+                vals.update({"ticket_id": ticket_ids[0]})
         return vals
 
-    def _prepare_vals(self):
+    def _get_tickets(self):
+        return self.ticket_ids or self.ticket_id
+
+    def _prepare_vals(self, ticket=None):
+        ticket = ticket or self.ticket_id
         return {
-            "ticket_id": self.ticket_id.id,
-            "name": self.ticket_id.name,
-            "partner_id": self.ticket_id.partner_id.id,
-            "user_id": self.user_id.id or self.ticket_id.user_id.id,
+            "ticket_id": ticket.id,
+            "name": ticket.name,
+            "partner_id": ticket.partner_id.id,
+            "user_id": self.user_id.id or ticket.user_id.id,
             "team_id": self.team_id.id,
-            "description": self.ticket_id.description,
+            "description": ticket.description,
             "type": "opportunity",
         }
 
-    def action_helpdesk_ticket_to_lead(self):
-        lead = self.env["crm.lead"].create(self._prepare_vals())
-        for follower in self.ticket_id.message_follower_ids:
-            lead.message_subscribe(
-                partner_ids=[follower.partner_id.id],
-                subtype_ids=follower.subtype_ids.ids,
-            )
-        self.ticket_id.write({"lead_ids": [(4, lead.id)]})
-        for message in self.ticket_id.message_ids:
-            message.copy(
-                {
-                    "model": lead._name,
-                    "res_id": lead.id,
-                    # prevent null value in column "notification_type" if message
-                    # have notifications (not copied)
-                    "notified_partner_ids": False,
-                }
+    def _copy_followers(self, leads):
+        """Copy the followers of the tickets on their leads at once.
+
+        The followers added on the leads at their creation get the subtypes
+        of the ticket followers, the other ones are created in one batch.
+        """
+        leads.check_access_rights("write")
+        leads.check_access_rule("write")
+        followers = self.env["mail.followers"].sudo()
+        existing = {
+            (follower.res_id, follower.partner_id.id): follower
+            for follower in followers.search(
+                [("res_model", "=", leads._name), ("res_id", "in", leads.ids)]
             )
+        }
+        to_update = defaultdict(lambda: followers)
+        vals_list = []
+        for lead in leads:
+            for follower in lead.ticket_id.message_follower_ids:
+                subtype_ids = follower.subtype_ids.ids
+                lead_follower = existing.get((lead.id, follower.partner_id.id))
+                if lead_follower:
+                    if subtype_ids:
+                        to_update[tuple(subtype_ids)] |= lead_follower
+                    continue
+                vals_list.append(
+                    {
+                        "res_model": lead._name,
+                        "res_id": lead.id,
+                        "partner_id": follower.partner_id.id,
+                        "subtype_ids": [(6, 0, subtype_ids)],
+                    }
+                )
+        followers.create(vals_list)
+        for subtype_ids, lead_followers in to_update.items():
+            lead_followers.write({"subtype_ids": [(6, 0, list(subtype_ids))]})
+
+    def _copy_messages(self, leads):
+        """Copy the messages of the tickets on their leads at once."""
+        vals_list = []
+        for lead in leads:
+            for message in lead.ticket_id.message_ids:
+                vals_list += message.copy_data(
+                    {
+                        "model": lead._name,
+                        "res_id": lead.id,
+                        # prevent null value in column "notification_type" if
+                        # message have notifications (not copied)
+                        "notified_partner_ids": False,
+                    }
+                )
+        self.env["mail.message"].create(vals_list)
+
+    def action_helpdesk_ticket_to_lead(self):
+        tickets = self._get_tickets()
+        leads = self.env["crm.lead"].create(
+            [self._prepare_vals(ticket) for ticket in tickets]
+        )
+        self._copy_followers(leads)
+        self._copy_messages(leads)
         # Chatter reflects new Lead
         body = Markup(
             _("This ticket has been converted to the opportunity %(lead_link)s")
-        ) % {"lead_link": lead._get_html_link(title=lead.name)}
-        self.ticket_id.with_user(SUPERUSER_ID).message_post(body=body)
-        return lead.get_formview_action()
+        )
+        tickets.with_user(SUPERUSER_ID)._message_log_batch(
+            bodies={
+                lead.ticket_id.id: body
+                % {"lead_link": lead._get_html_link(title=lead.name)}
+                for lead in leads
+            }
+        )
+        if len(leads) == 1:
+            return leads.get_formview_action()
+        action = self.env["ir.actions.act_window"]._for_xml_id(
+            "crm.crm_lead_action_pipeline"
+        )
+        action["domain"] = [("id", "in", leads.ids)]
+        return action
@@ -3,7 +3,7 @@
 {
     "name": "Helpdesk Ticket Merge",
     "summary": "Wizard to merge helpdesk tickets",
-    "version": "17.0.1.0.0",
+    "version": "17.0.1.2.4",
     "author": "Onestein, Odoo Community Association (OCA)",
     "website": "https://github.com/OCA/helpdesk",
     "license": "AGPL-3",
@@ -12,6 +12,7 @@
     "data": [
         "security/ir.model.access.csv",
         "wizard/helpdesk_ticket_merge_views.xml",
+        "views/helpdesk_ticket_views.xml",
     ],
     "installable": True,
 }
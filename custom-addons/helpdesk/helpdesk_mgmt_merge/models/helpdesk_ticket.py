@@ -0,0 +1,143 @@
+from collections import defaultdict
+
+from odoo import _, api, fields, models
+from odoo.tools import html2plaintext
+
+# Changing them changes the duplicate buckets of a ticket: only open tickets
+# are indexed
+INDEX_FIELDS = {"name", "description", "stage_id", "active"}
+
+
+class HelpdeskTicket(models.Model):
+    _inherit = "helpdesk.ticket"
+
+    duplicate_signature = fields.Char(
+        compute="_compute_duplicate_signature",
+        store=True,
+        copy=False,
+        prefetch=False,
+        help="MinHash signature of the title and description of the ticket.",
+    )
+    duplicate_ticket_count = fields.Integer(
+        compute="_compute_duplicate_ticket_count", string="Duplicates"
+    )
+
+    @api.depends("name", "description")
+    def _compute_duplicate_signature(self):
+        Bucket = self.env["helpdesk.ticket.duplicate.bucket"]
+        for ticket in self:
+            signature = Bucket._get_signature(ticket._get_duplicate_text())
+            ticket.duplicate_signature = " ".join(map(str, signature)) or False
+
+    def _compute_duplicate_ticket_count(self):
+        duplicates = self._get_duplicates()
+        for ticket in self:
+            ticket.duplicate_ticket_count = len(duplicates.get(ticket, ()))
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        tickets = super().create(vals_list)
+        self.env["helpdesk.ticket.duplicate.bucket"]._index_tickets(tickets)
+        return tickets
+
+    def write(self, vals):
+        res = super().write(vals)
+        if INDEX_FIELDS.intersection(vals):
+            self.env["helpdesk.ticket.duplicate.bucket"]._index_tickets(self)
+        return res
+
+    def _get_duplicate_text(self):
+        self.ensure_one()
+        return "\n".join((self.name or "", html2plaintext(self.description or "")))
+
+    def _get_duplicate_signature(self):
+        self.ensure_one()
+        return tuple(map(int, (self.duplicate_signature or "").split()))
+
+    def _get_duplicate_threshold(self):
+        return float(
+            self.env["ir.config_parameter"]
+            .sudo()
+            .get_param("helpdesk_mgmt_merge.duplicate_threshold", "0.5")
+        )
+
+    def _get_duplicates(self):
+        """Return the open tickets similar to each ticket.
+
+        The candidates come from the buckets shared with the ticket, and are
+        kept when the similarity of their signatures reaches the threshold.
+
+        :return: dict mapping tickets to their duplicate tickets
+        """
+        Bucket = self.env["helpdesk.ticket.duplicate.bucket"]
+        pairs = Bucket._get_candidate_pairs(self)
+        candidates = self.search(
+            [("id", "in", list({pair[1] for pair in pairs})), ("closed", "=", False)]
+        )
+        signatures = {
+            ticket.id: ticket._get_duplicate_signature()
+            for ticket in (self | candidates).with_prefetch()
+        }
+        candidate_ids = set(candidates.ids)
+        threshold = self._get_duplicate_threshold()
+        duplicate_ids = defaultdict(list)
+        for ticket_id, candidate_id in pairs:
+            if candidate_id not in candidate_ids:
+                continue
+            similarity = Bucket._get_similarity(
+                signatures[ticket_id], signatures[candidate_id]
+            )
+            if similarity >= threshold:
+                duplicate_ids[ticket_id].append(candidate_id)
+        return {
+            self.browse(ticket_id): self.browse(ids)
+            for ticket_id, ids in duplicate_ids.items()
+        }
+
+    def _get_duplicate_clusters(self):
+        """Group the tickets with their duplicates, transitively.
+
+        :return: list of ``(destination, tickets)`` tuples as expected by the
+            merge wizard, the destination being the oldest ticket of each
+            cluster
+        """
+        duplicates = {}
+        done = self.browse()
+        todo = self
+        while todo:
+            found = todo._get_duplicates()
+            duplicates.update(found)
+            done |= todo
+            todo = self.browse().union(*found.values()) - done
+        clusters = []
+        seen = self.browse()
+        for ticket in self:
+            if ticket in seen or ticket not in duplicates:
+                continue
+            cluster = todo = ticket
+            while todo:
+                found = self.browse().union(
+                    *(duplicates.get(record, self.browse()) for record in todo)
+                )
+                todo = found - cluster
+                cluster |= found
+            seen |= cluster
+            cluster = cluster.sorted("id")
+            clusters.append((cluster[:1], cluster))
+        return clusters
+
+    def action_merge_duplicates(self):
+        self.ensure_one()
+        clusters = self._get_duplicate_clusters()
+        cluster = clusters[0][1] if clusters else self
+        return {
+            "type": "ir.actions.act_window",
+            "name": _("Merge Helpdesk Tickets"),
+            "res_model": "helpdesk.ticket.merge",
+            "view_mode": "form",
+            "target": "new",
+            "context": {
+                "active_model": self._name,
+                "active_ids": cluster.ids,
+            },
+        }
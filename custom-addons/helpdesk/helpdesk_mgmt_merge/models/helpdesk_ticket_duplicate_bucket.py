@@ -0,0 +1,151 @@
+import random
+import re
+import zlib
+
+from psycopg2.extras import execute_values
+
+from odoo import api, fields, models
+from odoo.tools import create_index, split_every
+
+# MinHash signatures are made of NUM_BANDS bands of BAND_ROWS hashes, two
+# tickets become duplicate candidates as soon as one of their bands match.
+# With 16 bands of 4 rows, tickets sharing half of their shingles have about
+# 2/3 chances to be found, and tickets sharing 80% of them 99% chances.
+NUM_BANDS = 16
+BAND_ROWS = 4
+NUM_PERM = NUM_BANDS * BAND_ROWS
+SHINGLE_SIZE = 3
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+# Tickets (re)indexed per DELETE/INSERT statement
+INDEX_BATCH_SIZE = 1000
+# The permutations must be the same across processes and restarts
+_rng = random.Random(4242)
+PERMUTATIONS = [
+    (_rng.randrange(1, MERSENNE_PRIME), _rng.randrange(0, MERSENNE_PRIME))
+    for _i in range(NUM_PERM)
+]
+
+
+class HelpdeskTicketDuplicateBucket(models.Model):
+    """Locality-sensitive hash buckets of the ticket MinHash signatures.
+
+    Each ticket gets one row per band of its signature. Looking for the
+    duplicates of a ticket is an index lookup on its bands instead of a
+    comparison with all the other tickets.
+    """
+
+    _name = "helpdesk.ticket.duplicate.bucket"
+    _description = "Helpdesk Ticket Duplicate Bucket"
+    _log_access = False
+
+    ticket_id = fields.Many2one(
+        comodel_name="helpdesk.ticket",
+        required=True,
+        ondelete="cascade",
+        index=True,
+    )
+    band = fields.Integer(required=True)
+    bucket = fields.Integer(required=True)
+
+    def init(self):
+        super().init()
+        create_index(
+            self.env.cr,
+            "helpdesk_ticket_duplicate_bucket_band_bucket_index",
+            self._table,
+            ["band", "bucket"],
+        )
+        self.env.cr.execute(f"SELECT 1 FROM {self._table} LIMIT 1")
+        if not self.env.cr.rowcount:
+            tickets = self.env["helpdesk.ticket"].search([("closed", "=", False)])
+            for chunk in tickets._iter_chunks(
+                fnames=["duplicate_signature", "active", "stage_id"]
+            ):
+                self._index_tickets(chunk)
+
+    @api.model
+    def _get_shingles(self, text):
+        words = re.findall(r"\w+", (text or "").lower())
+        if len(words) < SHINGLE_SIZE:
+            return set(words)
+        return {
+            " ".join(words[i : i + SHINGLE_SIZE])
+            for i in range(len(words) - SHINGLE_SIZE + 1)
+        }
+
+    @api.model
+    def _get_signature(self, text):
+        """Return the MinHash signature of ``text``, empty without words."""
+        hashes = [zlib.crc32(shingle.encode()) for shingle in self._get_shingles(text)]
+        if not hashes:
+            return ()
+        return tuple(
+            min(((a * h + b) % MERSENNE_PRIME) & MAX_HASH for h in hashes)
+            for a, b in PERMUTATIONS
+        )
+
+    @api.model
+    def _get_bands(self, signature):
+        """Return the ``(band, bucket)`` keys of ``signature``."""
+        if len(signature) != NUM_PERM:
+            return []
+        bands = []
+        for band in range(NUM_BANDS):
+            rows = signature[band * BAND_ROWS : (band + 1) * BAND_ROWS]
+            bucket = zlib.crc32(",".join(map(str, rows)).encode()) & 0x7FFFFFFF
+            bands.append((band, bucket))
+        return bands
+
+    @api.model
+    def _get_similarity(self, signature1, signature2):
+        """Return the estimated Jaccard similarity of two signatures."""
+        if len(signature1) != NUM_PERM or len(signature2) != NUM_PERM:
+            return 0.0
+        return sum(h1 == h2 for h1, h2 in zip(signature1, signature2)) / NUM_PERM
+
+    @api.model
+    def _index_tickets(self, tickets):
+        """Replace the buckets of ``tickets`` by the ones of their signature.
+
+        Only open tickets are indexed: closed and archived tickets lose their
+        buckets, so lookups do not grow with the ticket history, and get them
+        back when reopened.
+        """
+        for ids in split_every(INDEX_BATCH_SIZE, tickets.ids):
+            self.env.cr.execute(
+                f"DELETE FROM {self._table} WHERE ticket_id IN %s", [tuple(ids)]
+            )
+            rows = [
+                (ticket.id, band, bucket)
+                for ticket in tickets.browse(ids)
+                if ticket.active and not ticket.closed
+                for band, bucket in self._get_bands(ticket._get_duplicate_signature())
+            ]
+            if rows:
+                execute_values(
+                    self.env.cr._obj,
+                    f"INSERT INTO {self._table} (ticket_id, band, bucket) VALUES %s",
+                    rows,
+                    page_size=len(rows),
+                )
+        self.invalidate_model()
+
+    @api.model
+    def _get_candidate_pairs(self, tickets):
+        """Return the ``(ticket, candidate)`` id pairs sharing a bucket."""
+        if not tickets.ids:
+            return set()
+        self.env.cr.execute(
+            f"""
+            SELECT DISTINCT src.ticket_id, dup.ticket_id
+              FROM {self._table} src
+              JOIN {self._table} dup
+                ON dup.band = src.band
+               AND dup.bucket = src.bucket
+               AND dup.ticket_id != src.ticket_id
+             WHERE src.ticket_id IN %s
+            """,
+            [tuple(tickets.ids)],
+        )
+        return set(self.env.cr.fetchall())
@@ -1,4 +1,11 @@
+from unittest.mock import patch
+
+from odoo.exceptions import UserError
+
 from odoo.addons.base.tests.common import BaseCommon
+from odoo.addons.helpdesk_mgmt_merge.models import (
+    helpdesk_ticket_duplicate_bucket as bucket_module,
+)
 
 
 class TestHelpdeskTicketMerge(BaseCommon):
@@ -35,3 +42,103 @@ class TestHelpdeskTicketMerge(BaseCommon):
         self.assertTrue(self.ticket_merge_2.user_id)
         self.ticket_merge_2.merge_tickets()
         self.assertEqual(self.ticket_merge_2.dst_ticket_id.name, "Ticket 2")
+        self.assertIn("Description for Ticket 1", self.ticket_2.description)
+        message = self.ticket_1.message_ids[0]
+        self.assertEqual(message.subtype_id, self.env.ref("mail.mt_comment"))
+        self.assertIn(
+            f"This helpdesk ticket has been merged to {self.ticket_2.number}",
+            message.body,
+        )
+
+    def test_helpdesk_ticket_merge_clusters(self):
+        ticket_3 = self._create_ticket("Ticket 3", "Description for Ticket 3")
+        ticket_4 = self._create_ticket("Ticket 4", "Description for Ticket 4")
+        ticket_5 = self._create_ticket("Ticket 5", "Description for Ticket 5")
+        tag = self.env["helpdesk.ticket.tag"].create({"name": "Outage"})
+        ticket_2 = self.ticket_2
+        (ticket_2 | ticket_5).tag_ids = tag
+        attachment = self.env["ir.attachment"].create(
+            {
+                "name": "log.txt",
+                "res_model": "helpdesk.ticket",
+                "res_id": ticket_5.id,
+            }
+        )
+        partner = self.env["res.partner"].create({"name": "Follower"})
+        ticket_2.message_subscribe(partner_ids=partner.ids)
+        destinations = self.HelpdeskTicketMerge._merge_clusters(
+            [
+                (self.ticket_1, self.ticket_1 | ticket_2 | ticket_3),
+                (ticket_4, ticket_5),
+            ],
+            log_messages=True,
+        )
+        self.env.invalidate_all()
+        self.assertEqual(destinations, self.ticket_1 | ticket_4)
+        self.assertFalse((ticket_2 | ticket_3 | ticket_5).filtered("active"))
+        self.assertEqual(self.ticket_1.tag_ids, tag)
+        self.assertEqual(ticket_4.tag_ids, tag)
+        self.assertEqual(ticket_2.tag_ids, tag)
+        self.assertEqual(attachment.res_id, ticket_4.id)
+        self.assertIn(partner, self.ticket_1.message_partner_ids)
+        self.assertNotIn(partner, ticket_4.message_partner_ids)
+        self.assertIn("Description for Ticket 3", self.ticket_1.description)
+        self.assertNotIn("Description for Ticket 5", self.ticket_1.description)
+        self.assertIn("Description for Ticket 5", ticket_4.description)
+        self.assertIn(ticket_3.number, self.ticket_1.message_ids[0].body)
+        self.assertIn(self.ticket_1.number, ticket_3.message_ids[0].body)
+        self.assertEqual(
+            ticket_3.message_ids[0].subtype_id, self.env.ref("mail.mt_note")
+        )
+        self.assertEqual(self.ticket_1.write_uid, self.env.user)
+        self.assertEqual(attachment.write_uid, self.env.user)
+        with self.assertRaises(UserError):
+            self.HelpdeskTicketMerge._merge_clusters(
+                [(self.ticket_1, ticket_4), (ticket_4, ticket_2)]
+            )
+
+    def test_helpdesk_ticket_duplicates(self):
+        description = (
+            "The mail server does not answer since this morning and nobody in "
+            "the accounting department can send invoices to the customers"
+        )
+        tickets = self.env["helpdesk.ticket"].create(
+            [
+                {"name": "Mail server down", "description": description},
+                {"name": "Mail server down", "description": description + "!"},
+                {"name": "mail server down", "description": description.upper()},
+            ]
+        )
+        self.assertTrue(tickets[0].duplicate_signature)
+        duplicates = tickets[0]._get_duplicates()
+        self.assertEqual(duplicates[tickets[0]], tickets[1:])
+        self.assertNotIn(self.ticket_1, duplicates[tickets[0]])
+        self.assertEqual(tickets[0].duplicate_ticket_count, 2)
+        self.assertEqual(
+            (tickets | self.ticket_1)._get_duplicate_clusters(),
+            [(tickets[0], tickets)],
+        )
+        action = tickets[1].action_merge_duplicates()
+        wizard = self.HelpdeskTicketMerge.with_context(**action["context"]).create({})
+        self.assertEqual(wizard.ticket_ids, tickets)
+        self.assertEqual(wizard.dst_ticket_id, tickets[0])
+        # Duplicates are no longer found once the description changed
+        tickets[2].description = "Printer out of paper"
+        self.assertEqual(tickets[0]._get_duplicates()[tickets[0]], tickets[1])
+        # Archived tickets leave the buckets, and come back when restored
+        Bucket = self.env["helpdesk.ticket.duplicate.bucket"]
+        tickets[1].active = False
+        self.assertFalse(Bucket.search([("ticket_id", "=", tickets[1].id)]))
+        self.assertFalse(tickets[0]._get_duplicates())
+        tickets[1].active = True
+        self.assertEqual(tickets[0]._get_duplicates()[tickets[0]], tickets[1])
+
+    def test_helpdesk_ticket_duplicate_backfill(self):
+        Bucket = self.env["helpdesk.ticket.duplicate.bucket"]
+        tickets = self.ticket_1 | self.ticket_2
+        self.env.cr.execute(f"DELETE FROM {Bucket._table}")
+        with patch.object(bucket_module, "INDEX_BATCH_SIZE", 1):
+            Bucket.init()
+        buckets = Bucket.search([("ticket_id", "in", tickets.ids)])
+        self.assertEqual(len(buckets), 2 * bucket_module.NUM_BANDS)
+        self.assertEqual(buckets.ticket_id, tickets)
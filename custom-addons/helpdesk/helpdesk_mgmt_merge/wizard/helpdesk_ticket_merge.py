@@ -1,4 +1,5 @@
 from odoo import Command, _, api, fields, models
+from odoo.exceptions import UserError
 
 
 class HelpdeskTicketMerge(models.TransientModel):
@@ -19,14 +20,8 @@ class HelpdeskTicketMerge(models.TransientModel):
     )
 
     def merge_tickets(self):
-        tag_ids = self.ticket_ids.mapped("tag_ids").ids
-        attachment_ids = self.ticket_ids.mapped("attachment_ids").ids
         user_ids = self.ticket_ids.mapped("user_ids").ids
         values = {
-            "tag_ids": [Command.link(tag_id) for tag_id in tag_ids],
-            "attachment_ids": [
-                Command.link(attachment_id) for attachment_id in attachment_ids
-            ],
             "user_ids": [Command.link(user_id) for user_id in user_ids],
         }
 
@@ -58,21 +53,12 @@ class HelpdeskTicketMerge(models.TransientModel):
 
             self.dst_ticket_id = self.env["helpdesk.ticket"].create(values)
         else:
-            values["description"] = "\n".join(
-                (
-                    self.dst_ticket_id.description or "",
-                    self._merge_description(self.ticket_ids - self.dst_ticket_id),
-                )
-            )
             self.dst_ticket_id.write(values)
 
-        merged_tickets = self.ticket_ids - self.dst_ticket_id
-        self._merge_followers(merged_tickets)
-        for ticket in merged_tickets:
-            self._add_message("to", self.dst_ticket_id.number, ticket)
-        ticket_numbers = ", ".join(merged_tickets.mapped("number"))
-        self._add_message("from", ticket_numbers, self.dst_ticket_id)
-        merged_tickets.write({"active": False})
+        self._merge_clusters(
+            [(self.dst_ticket_id, self.ticket_ids)],
+            merge_description=not self.create_new_ticket,
+        )
 
         return {
             "type": "ir.actions.act_window",
@@ -81,22 +67,225 @@ class HelpdeskTicketMerge(models.TransientModel):
             "res_id": self.dst_ticket_id.id,
         }
 
-    def _merge_description(self, tickets):
-        return "\n".join(
-            tickets.mapped(
-                lambda ticket: _("Description from ticket %(name)s: %(description)s")
-                % {
-                    "name": ticket.name,
-                    "description": ticket.description or _("No description"),
-                }
+    @api.model
+    def _merge_clusters(self, clusters, merge_description=True, log_messages=False):
+        """Merge clusters of tickets in one go.
+
+        The tags, attachments and followers of the merged tickets are
+        relinked to their destination with one query per relation whatever
+        the number of clusters, and the merged tickets are archived.
+
+        :param clusters: iterable of ``(destination, tickets)`` tuples, the
+            tickets are merged into their destination ticket
+        :param merge_description: append the descriptions of the merged
+            tickets to the description of their destination
+        :param log_messages: bulk merge: advise the tickets about the merge
+            with internal notes logged in batch instead of posting a message
+            on each of them, and update the destination descriptions in SQL
+            instead of writing them one by one
+        :return: the destination tickets
+        """
+        Ticket = self.env["helpdesk.ticket"]
+        mapping = {}
+        for destination, tickets in clusters:
+            destination.ensure_one()
+            for ticket in tickets - destination:
+                if ticket.id in mapping:
+                    raise UserError(
+                        _(
+                            "Ticket %(ticket)s can't be merged into several tickets.",
+                            ticket=ticket.display_name,
+                        )
+                    )
+                mapping[ticket.id] = destination.id
+        merged_tickets = Ticket.browse(list(mapping))
+        destinations = Ticket.browse(list(dict.fromkeys(mapping.values())))
+        if merged_tickets & destinations:
+            raise UserError(
+                _("A destination ticket can't be merged into another ticket.")
+            )
+        if not mapping:
+            return destinations
+        (merged_tickets | destinations).check_access_rights("write")
+        (merged_tickets | destinations).check_access_rule("write")
+        self.env.flush_all()
+        if merge_description:
+            self._merge_cluster_descriptions(
+                merged_tickets, destinations, mapping, bulk=log_messages
+            )
+        self._merge_cluster_tags(mapping)
+        self._merge_cluster_attachments(mapping)
+        self._merge_cluster_followers(merged_tickets, mapping)
+        self._post_cluster_messages(
+            merged_tickets, destinations, mapping, log_messages=log_messages
+        )
+        merged_tickets.write({"active": False})
+        return destinations
+
+    def _get_merge_values_query(self, mapping):
+        """Return the ``VALUES`` query and params of ``mapping`` items."""
+        return ", ".join(["%s"] * len(mapping)), list(mapping.items())
+
+    def _merge_cluster_descriptions(
+        self, merged_tickets, destinations, mapping, bulk=False
+    ):
+        """Append the descriptions of the merged tickets to their destination.
+
+        Bulk merges update all the destinations with a single query, other
+        merges write each destination through the ORM, with its tracking and
+        write overrides.
+        """
+        (merged_tickets | destinations).fetch(["name", "description"])
+        descriptions = {
+            destination: [destination.description or ""]
+            for destination in destinations
+        }
+        for ticket in merged_tickets:
+            destination = destinations.browse(mapping[ticket.id])
+            descriptions[destination].append(self._get_description_line(ticket))
+        field = destinations._fields["description"]
+        values = {
+            destination.id: str(
+                field.convert_to_cache("\n".join(lines), destination) or ""
             )
+            for destination, lines in descriptions.items()
+        }
+        if not bulk:
+            for destination in destinations:
+                destination.write({"description": values[destination.id]})
+            return
+        values_query, params = self._get_merge_values_query(values)
+        self.env.cr.execute(
+            f"""
+            UPDATE helpdesk_ticket ticket
+               SET description = merge.description,
+                   write_uid = %s,
+                   write_date = %s
+              FROM (VALUES {values_query}) AS merge(id, description)
+             WHERE ticket.id = merge.id
+            """,
+            [self.env.uid, fields.Datetime.now(), *params],
+        )
+        destinations.invalidate_recordset(["description", "write_uid", "write_date"])
+        destinations.modified(["description"])
+        self.env["helpdesk.ticket.duplicate.bucket"]._index_tickets(destinations)
+
+    def _merge_cluster_tags(self, mapping):
+        field = self.env["helpdesk.ticket"]._fields["tag_ids"]
+        values_query, params = self._get_merge_values_query(mapping)
+        self.env.cr.execute(
+            f"""
+            INSERT INTO {field.relation} ({field.column1}, {field.column2})
+            SELECT DISTINCT merge.dst_id, rel.{field.column2}
+              FROM {field.relation} rel
+              JOIN (VALUES {values_query}) AS merge(src_id, dst_id)
+                ON merge.src_id = rel.{field.column1}
+                ON CONFLICT DO NOTHING
+            """,
+            params,
+        )
+        destinations = self.env["helpdesk.ticket"].browse(set(mapping.values()))
+        self.env["helpdesk.ticket"].invalidate_model(["tag_ids"])
+        destinations.modified(["tag_ids"])
+
+    def _merge_cluster_attachments(self, mapping):
+        values_query, params = self._get_merge_values_query(mapping)
+        self.env.cr.execute(
+            f"""
+            UPDATE ir_attachment attachment
+               SET res_id = merge.dst_id,
+                   write_uid = %s,
+                   write_date = %s
+              FROM (VALUES {values_query}) AS merge(src_id, dst_id)
+             WHERE attachment.res_model = 'helpdesk.ticket'
+               AND attachment.res_field IS NULL
+               AND attachment.res_id = merge.src_id
+         RETURNING attachment.id
+            """,
+            [self.env.uid, fields.Datetime.now(), *params],
         )
+        attachments = self.env["ir.attachment"].browse(
+            [row[0] for row in self.env.cr.fetchall()]
+        )
+        attachments.invalidate_recordset(["res_id", "write_uid", "write_date"])
+        self.env["helpdesk.ticket"].invalidate_model(["attachment_ids"])
+        attachments.modified(["res_id"])
+
+    def _merge_cluster_followers(self, merged_tickets, mapping):
+        """Subscribe the followers of the merged tickets to their destination.
 
-    def _merge_followers(self, merged_tickets):
-        self.dst_ticket_id.message_subscribe(
-            partner_ids=(merged_tickets).mapped("message_partner_ids").ids,
+        The missing followers are created at once, with the subtypes they had
+        on the merged tickets.
+        """
+        followers = self.env["mail.followers"].sudo()
+        existing = {
+            (follower.res_id, follower.partner_id.id)
+            for follower in followers.search(
+                [
+                    ("res_model", "=", "helpdesk.ticket"),
+                    ("res_id", "in", list(set(mapping.values()))),
+                ]
+            )
+        }
+        subtypes = {}
+        for follower in followers.search(
+            [
+                ("res_model", "=", "helpdesk.ticket"),
+                ("res_id", "in", merged_tickets.ids),
+            ]
+        ):
+            key = (mapping[follower.res_id], follower.partner_id.id)
+            if key not in existing:
+                subtypes.setdefault(key, set()).update(follower.subtype_ids.ids)
+        followers.create(
+            [
+                {
+                    "res_model": "helpdesk.ticket",
+                    "res_id": res_id,
+                    "partner_id": partner_id,
+                    "subtype_ids": [Command.set(list(subtype_ids))],
+                }
+                for (res_id, partner_id), subtype_ids in subtypes.items()
+            ]
         )
 
+    def _post_cluster_messages(
+        self, merged_tickets, destinations, mapping, log_messages=False
+    ):
+        merged_numbers = {destination.id: [] for destination in destinations}
+        bodies = {}
+        for ticket in merged_tickets:
+            destination = destinations.browse(mapping[ticket.id])
+            merged_numbers[destination.id].append(ticket.number)
+            bodies[ticket.id] = self._get_merge_message_body("to", destination.number)
+        for destination_id, numbers in merged_numbers.items():
+            bodies[destination_id] = self._get_merge_message_body(
+                "from", ", ".join(numbers)
+            )
+        tickets = merged_tickets | destinations
+        if log_messages:
+            tickets._message_log_batch(bodies=bodies)
+            return
+        for ticket in tickets:
+            ticket.message_post(
+                body=bodies[ticket.id],
+                subject=_("Merge helpdesk ticket"),
+                message_type="comment",
+                subtype_xmlid="mail.mt_comment",
+            )
+
+    def _get_description_line(self, ticket):
+        return _("Description from ticket %(name)s: %(description)s") % {
+            "name": ticket.name,
+            "description": ticket.description or _("No description"),
+        }
+
+    def _merge_description(self, tickets):
+        descriptions = []
+        for chunk in tickets._iter_chunks(fnames=["name", "description"]):
+            descriptions += chunk.mapped(self._get_description_line)
+        return "\n".join(descriptions)
+
     def default_get(self, fields):
         result = super().default_get(fields)
         selected_tickets = self.env["helpdesk.ticket"].browse(
@@ -118,18 +307,13 @@ class HelpdeskTicketMerge(models.TransientModel):
         if self.dst_ticket_id.user_id:
             self.user_id = self.dst_ticket_id.user_id
 
-    def _add_message(self, way, ticket_numbers, ticket):
-        """Send a message post with to advise the helpdesk ticket about the merge.
+    def _get_merge_message_body(self, way, ticket_numbers):
+        """Return the note advising a helpdesk ticket about the merge.
         :param way : choice between "from" or "to"
         :param ticket_numbers : list of helpdesk ticket numbers to add in the body
-        :param ticket : the ticket where the message will be posted
         """
-        subject = "Merge helpdesk ticket"
-        body = _(f"This helpdesk ticket has been merged {way} {ticket_numbers}")
-
-        ticket.message_post(
-            body=body,
-            subject=subject,
-            message_type="comment",
-            subtype_id=self.env.ref("mail.mt_comment").id,
+        return _(
+            "This helpdesk ticket has been merged %(way)s %(tickets)s",
+            way=way,
+            tickets=ticket_numbers,
         )
@@ -1,3 +1,4 @@
+from . import helpdesk_ticket_count_mixin
 from . import helpdesk_ticket
 from . import helpdesk_ticket_team
 from . import project
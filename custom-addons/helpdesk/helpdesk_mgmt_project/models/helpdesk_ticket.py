@@ -5,7 +5,7 @@ class HelpdeskTicket(models.Model):
     _inherit = "helpdesk.ticket"
 
     project_id = fields.Many2one(
-        string="Project", comodel_name="project.project", tracking=True
+        string="Project", comodel_name="project.project", tracking=True, index=True
     )
     task_id = fields.Many2one(
         string="Task",
@@ -14,6 +14,7 @@ class HelpdeskTicket(models.Model):
         readonly=False,
         store=True,
         tracking=True,
+        index=True,
     )
 
     @api.depends("project_id")
@@ -0,0 +1,90 @@
+import operator
+
+from odoo import _, api, models
+from odoo.exceptions import UserError
+from odoo.tools import SQL
+
+OPERATORS = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+class HelpdeskTicketCountMixin(models.AbstractModel):
+    """Count the tickets linked to a record through ``_ticket_count_field``.
+
+    The counters are not stored: a stage change of a ticket would otherwise
+    update the row of its project or task, making busy projects a lock
+    bottleneck. They are aggregated from the indexed ticket column instead.
+    Like the stored counters they replace, they count all the tickets of
+    the record, whatever the record rules of the current user.
+    """
+
+    _name = "helpdesk.ticket.count.mixin"
+    _description = "Helpdesk Ticket Counters"
+
+    _ticket_count_field = None
+
+    def _get_ticket_counts(self, domain, todo=False):
+        domain = [(self._ticket_count_field, "!=", False)] + domain
+        if todo:
+            domain.append(("closed", "=", False))
+        return {
+            record.id: count
+            for record, count in self.env["helpdesk.ticket"]
+            .sudo()
+            ._read_group(domain, [self._ticket_count_field], ["__count"])
+        }
+
+    @api.depends("ticket_ids", "ticket_ids.stage_id")
+    def _compute_ticket_count(self):
+        domain = [(self._ticket_count_field, "in", self.ids)]
+        counts = self._get_ticket_counts(domain)
+        counts_todo = self._get_ticket_counts(domain, todo=True)
+        for record in self:
+            record.ticket_count = counts.get(record.id, 0)
+            record.todo_ticket_count = counts_todo.get(record.id, 0)
+
+    def _get_ticket_count_query(self, having, todo=False):
+        """Return the ids of the records whose ticket count matches ``having``."""
+        tickets = self.env["helpdesk.ticket"]
+        tickets.flush_model([self._ticket_count_field, "stage_id", "active"])
+        self.env["helpdesk.ticket.stage"].flush_model(["closed"])
+        field = SQL.identifier("ticket", self._ticket_count_field)
+        return SQL(
+            """
+            SELECT %(field)s
+              FROM helpdesk_ticket ticket
+         LEFT JOIN helpdesk_ticket_stage stage ON stage.id = ticket.stage_id
+             WHERE %(field)s IS NOT NULL
+               AND ticket.active
+               AND %(todo)s
+             GROUP BY %(field)s
+            HAVING %(having)s
+            """,
+            field=field,
+            todo=SQL("stage.id IS NOT NULL AND stage.closed IS NOT TRUE")
+            if todo
+            else SQL("TRUE"),
+            having=having,
+        )
+
+    def _search_ticket_count_by(self, operator, value, todo=False):
+        if operator not in OPERATORS or not isinstance(value, int):
+            raise UserError(_("Unsupported search on the number of tickets."))
+        having = SQL(f"COUNT(*) {operator} %s", value)
+        if OPERATORS[operator](0, value):
+            # Records without tickets match as well
+            query = self._get_ticket_count_query(SQL("NOT (%s)", having), todo=todo)
+            return [("id", "not in", query)]
+        return [("id", "in", self._get_ticket_count_query(having, todo=todo))]
+
+    def _search_ticket_count(self, operator, value):
+        return self._search_ticket_count_by(operator, value)
+
+    def _search_todo_ticket_count(self, operator, value):
+        return self._search_ticket_count_by(operator, value, todo=True)
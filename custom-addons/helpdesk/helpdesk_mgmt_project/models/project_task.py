@@ -1,13 +1,19 @@
-from odoo import _, api, fields, models
+from odoo import _, fields, models
 
 
 class ProjectTask(models.Model):
-    _inherit = "project.task"
+    _name = "project.task"
+    _inherit = ["project.task", "helpdesk.ticket.count.mixin"]
+    _ticket_count_field = "task_id"
 
     ticket_ids = fields.One2many(
         comodel_name="helpdesk.ticket", inverse_name="task_id", string="Tickets"
     )
-    ticket_count = fields.Integer(compute="_compute_ticket_count", store=True)
+    ticket_count = fields.Integer(
+        compute="_compute_ticket_count",
+        compute_sudo=True,
+        search="_search_ticket_count",
+    )
     label_tickets = fields.Char(
         string="Use Tickets as",
         default=lambda s: _("Tickets"),
@@ -15,29 +21,12 @@ class ProjectTask(models.Model):
         help="Gives label to tickets on project's kanban view.",
     )
     todo_ticket_count = fields.Integer(
-        string="Number of tickets", compute="_compute_ticket_count", store=True
+        string="Number of tickets",
+        compute="_compute_ticket_count",
+        compute_sudo=True,
+        search="_search_todo_ticket_count",
     )
 
-    @api.depends("ticket_ids", "ticket_ids.stage_id")
-    def _compute_ticket_count(self):
-        HelpdeskTicket = self.env["helpdesk.ticket"]
-        invname = "task_id"
-        domain = [(invname, "in", self.ids)]
-        fields = [invname]
-        groupby = [invname]
-        counts = {
-            pr[invname][0]: pr[f"{invname}_count"]
-            for pr in HelpdeskTicket.read_group(domain, fields, groupby)
-        }
-        domain.append(("closed", "=", False))
-        counts_todo = {
-            pr[invname][0]: pr[f"{invname}_count"]
-            for pr in HelpdeskTicket.read_group(domain, fields, groupby)
-        }
-        for record in self:
-            record.ticket_count = counts.get(record.id, 0)
-            record.todo_ticket_count = counts_todo.get(record.id, 0)
-
     def action_view_ticket(self):
         result = self.env["ir.actions.act_window"]._for_xml_id(
             "helpdesk_mgmt.action_helpdesk_ticket_kanban_from_dashboard"
@@ -80,3 +80,29 @@ class TestHelpdeskTicketProject(TestHelpdeskTicketBase):
             1,
             "Helpdesk Ticket: Task have one realted tickets.",
         )
+
+    def test_helpdesk_ticket_counts_search(self):
+        Project = self.env["project.project"]
+        projects = self.project1 | self.project2
+        self.assertEqual(
+            Project.search(
+                [("id", "in", projects.ids), ("todo_ticket_count", ">", 0)]
+            ),
+            self.project1,
+        )
+        self.assertEqual(
+            Project.search([("id", "in", projects.ids), ("ticket_count", "=", 0)]),
+            self.project2,
+        )
+        (self.ticket | self.ticket2).write({"stage_id": self.stage_closed.id})
+        self.assertFalse(
+            Project.search(
+                [("id", "in", projects.ids), ("todo_ticket_count", ">", 0)]
+            )
+        )
+        self.assertEqual(
+            self.env["project.task"].search(
+                [("id", "=", self.task_project1.id), ("ticket_count", ">=", 2)]
+            ),
+            self.task_project1,
+        )
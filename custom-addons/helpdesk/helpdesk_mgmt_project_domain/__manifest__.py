@@ -4,7 +4,7 @@
 {
     "name": "Helpdesk Mgmt Project Domain",
     "summary": """Enable to set a project domain on ticket""",
-    "version": "17.0.1.0.0",
+    "version": "17.0.1.4.2",
     "license": "AGPL-3",
     "author": "Escodoo, Odoo Community Association (OCA)",
     "maintainers": ["marcelsavegnago"],
@@ -13,6 +13,7 @@
         "helpdesk_mgmt_project",
     ],
     "data": [
+        "security/ir.model.access.csv",
         "views/helpdesk_ticket_view.xml",
         "views/helpdesk_ticket_team_view.xml",
         "views/res_config_settings.xml",
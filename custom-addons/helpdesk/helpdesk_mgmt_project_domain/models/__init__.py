@@ -2,3 +2,4 @@ from . import helpdesk_ticket
 from . import helpdesk_ticket_team
 from . import res_company
 from . import res_config_settings
+from . import helpdesk_ticket_team_domain_stat
@@ -1,14 +1,18 @@
 # Copyright 2025 Marcel Savegnago - https://www.escodoo.com.br
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
 
+import ast
 import logging
+import time
 
-from odoo import _, api, fields, models
+from odoo import _, api, fields, models, tools
 from odoo.osv import expression
-from odoo.tools.safe_eval import safe_eval
+from odoo.tools.safe_eval import safe_eval, test_python_expr
 
 _logger = logging.getLogger(__name__)
 
+DOMAIN_MEMO_KEY = "helpdesk_mgmt_project_domain.memo"
+
 
 class HelpdeskTicket(models.Model):
     _inherit = "helpdesk.ticket"
@@ -17,43 +21,29 @@ class HelpdeskTicket(models.Model):
     # Computed fields for views
     # ----------------------------
 
-    project_domain_ids = fields.Many2many(
-        "project.project",
-        string="Available Projects",
-        compute="_compute_project_domain_ids",
-        help="Projects available for selection based on domain rules",
+    project_id_domain = fields.Binary(
+        compute="_compute_project_id_domain",
+        help="Domain of the projects available for selection based on domain rules",
     )
 
-    task_domain_ids = fields.Many2many(
-        "project.task",
-        string="Available Tasks",
-        compute="_compute_task_domain_ids",
-        help="Tasks available for selection based on domain rules",
+    task_id_domain = fields.Binary(
+        compute="_compute_task_id_domain",
+        help="Domain of the tasks available for selection based on domain rules",
     )
 
     @api.depends("team_id", "partner_id", "category_id", "priority", "company_id")
-    def _compute_project_domain_ids(self):
-        """Compute available project IDs based on domain rules"""
+    def _compute_project_id_domain(self):
+        """Compute the project domain, applied by the client when searching"""
         for record in self:
-            domain = record._get_project_domain_dynamic()
-            if domain:
-                projects = self.env["project.project"].search(domain)
-                record.project_domain_ids = projects
-            else:
-                record.project_domain_ids = self.env["project.project"]
+            record.project_id_domain = record._get_project_domain_dynamic()
 
     @api.depends(
         "team_id", "partner_id", "category_id", "priority", "company_id", "project_id"
     )
-    def _compute_task_domain_ids(self):
-        """Compute available task IDs based on domain rules"""
+    def _compute_task_id_domain(self):
+        """Compute the task domain, applied by the client when searching"""
         for record in self:
-            domain = record._get_task_domain_dynamic()
-            if domain:
-                tasks = self.env["project.task"].search(domain)
-                record.task_domain_ids = tasks
-            else:
-                record.task_domain_ids = self.env["project.task"]
+            record.task_id_domain = record._get_task_domain_dynamic()
 
     # ----------------------------
     # Public API (views/onchange)
@@ -161,10 +151,20 @@ class HelpdeskTicket(models.Model):
         """Evaluate textual domain with safe_eval and normalize; on error, return []."""
         if not expr:
             return []
+        return list(self._parse_domain_text(expr, self.env.uid))
+
+    @api.model
+    @tools.ormcache("expr", "uid")
+    def _parse_domain_text(self, expr, uid):
+        """Parse a static domain once per text and user.
+
+        The cache key is the domain text itself, so editing the domain of a
+        team or company is picked up immediately.
+        """
         try:
-            dom = safe_eval(expr, {"uid": self.env.uid})
+            dom = safe_eval(expr, {"uid": uid})
             if isinstance(dom, (list | tuple)):
-                return expression.normalize_domain(list(dom))
+                return tuple(expression.normalize_domain(list(dom)))
             _logger.warning(
                 "Evaluated domain is not a list/tuple (expr=%s, type=%s)",
                 expr,
@@ -172,7 +172,23 @@ class HelpdeskTicket(models.Model):
             )
         except Exception as e:
             _logger.error("Failed to evaluate static domain (expr=%s): %s", expr, e)
-        return []
+        return ()
+
+    @api.model
+    @tools.ormcache("python_code")
+    def _get_python_domain_mode(self, python_code):
+        """Return the ``safe_eval`` mode of domain Python code.
+
+        Code that is a valid plain expression is evaluated in ``eval`` mode,
+        anything else (e.g. code assigning ``domain``) in ``exec`` mode, so
+        it is never run twice. Only this check is cached: ``safe_eval``
+        refuses code objects, so the code itself is checked and compiled by
+        ``safe_eval`` on each evaluation. Evaluations are saved by sharing
+        results between tickets instead, see ``_get_source_domains``.
+        """
+        if test_python_expr(python_code.strip(), mode="eval"):
+            return "exec"
+        return "eval"
 
     def _run_python_domain(self, python_code, base_domain=None):
         """
@@ -183,13 +199,13 @@ class HelpdeskTicket(models.Model):
             - base_domain (already normalized list)
             - AND, OR, normalize (from odoo.osv.expression)
         """
-        if not python_code:
+        if not python_code or not python_code.strip():
             return []
 
         base_domain = expression.normalize_domain(base_domain or [])
 
         # Safe globals and helpers
-        safe_globals = {
+        eval_context = {
             "env": self.env,
             "user": self.env.user,
             "company": self.env.company,
@@ -200,21 +216,11 @@ class HelpdeskTicket(models.Model):
             "OR": expression.OR,
             "normalize": expression.normalize_domain,
         }
-
-        # 1) Try as an expression that directly returns a domain
         try:
-            maybe = safe_eval(python_code.strip(), safe_globals)
-            if isinstance(maybe, (list | tuple)):
-                return expression.normalize_domain(list(maybe))
-        except Exception as e:
-            # Fallback to exec mode below
-            _logger.debug("Failed to evaluate Python domain as expression: %s", e)
-
-        # 2) "Server action" style: script assigns `domain = [...]`
-        eval_context = dict(safe_globals)
-        try:
-            safe_eval(python_code.strip(), eval_context, mode="exec", nocopy=True)
-            dom = eval_context.get("domain", [])
+            mode = self._get_python_domain_mode(python_code)
+            dom = safe_eval(python_code.strip(), eval_context, mode=mode, nocopy=True)
+            if mode == "exec":
+                dom = eval_context.get("domain", [])
             if isinstance(dom, (list | tuple)):
                 return expression.normalize_domain(list(dom))
             if dom:
@@ -227,40 +233,203 @@ class HelpdeskTicket(models.Model):
 
         return []
 
-    def _compute_project_domain_from_sources(self, team=None, company=None):
+    @api.model
+    @tools.ormcache("python_code")
+    def _get_python_domain_paths(self, python_code):
+        """Return the ticket field paths read by domain Python code.
+
+        Only ``ticket.<field>[.<field>...]`` accesses are understood; when the
+        code uses ``ticket`` in any other way, ``None`` is returned and the
+        result of the code is considered specific to the ticket.
         """
-        Simplified logic - all domains are combined with AND:
+        try:
+            tree = ast.parse(python_code.strip())
+        except SyntaxError:
+            return None
+        parents = {
+            child: node
+            for node in ast.walk(tree)
+            for child in ast.iter_child_nodes(node)
+        }
+        paths = set()
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Name) or node.id != "ticket":
+                continue
+            model = self
+            fnames = []
+            parent = parents.get(node)
+            while isinstance(parent, ast.Attribute) and parent.attr in model._fields:
+                field = model._fields[parent.attr]
+                fnames.append(parent.attr)
+                if not field.relational:
+                    break
+                model = self.env[field.comodel_name]
+                parent = parents.get(parent)
+            if not fnames:
+                return None
+            paths.add(".".join(fnames))
+        return tuple(sorted(paths))
+
+    def _get_source_domains_key(self, kind, team, company):
+        """Return the memo key of the source domains of ``kind``.
+
+        The key holds the domain rules themselves and the values of the
+        ticket fields read by the team Python code, so tickets sharing those
+        values share the result. When the fields read by the code are not
+        known, the key holds the ticket itself instead.
+        """
+        python_code = team[f"{kind}_domain_python"] if team else False
+        paths = ()
+        if python_code and python_code.strip():
+            paths = self._get_python_domain_paths(python_code)
+        if paths is None:
+            values = self
+        else:
+            values = []
+            for path in paths:
+                value = self.mapped(path)
+                if isinstance(value, models.BaseModel):
+                    value = value._ids
+                values.append((path, tuple(value)))
+            values = tuple(values)
+        return (
+            kind,
+            self.env.uid,
+            self.env.company.id,
+            company.id if company else False,
+            team.id if team else False,
+            company[f"helpdesk_mgmt_{kind}_domain"] if company else False,
+            team[f"{kind}_domain"] if team else False,
+            python_code,
+            values,
+        )
+
+    def _get_source_domains(self, kind, team=None, company=None):
+        """Return the company, team and team Python code domains of ``kind``.
+
+        Results are memoized for the current transaction and, when the domain
+        cache is enabled, across transactions in the registry cache.
+        """
+        key = self._get_source_domains_key(kind, team, company)
+        try:
+            hash(key)
+        except TypeError:
+            return [
+                list(domain)
+                for domain in self._compute_source_domains(kind, team, company)
+            ]
+        memo = self.env.cr.precommit.data.setdefault(DOMAIN_MEMO_KEY, {})
+        if key not in memo:
+            if isinstance(key[-1], tuple) and self._use_domain_cache():
+                memo[key] = self._get_cached_source_domains(key, team, company)
+            else:
+                memo[key] = self._compute_source_domains(kind, team, company)
+        return [list(domain) for domain in memo[key]]
+
+    @api.model
+    def _use_domain_cache(self):
+        return tools.str2bool(
+            self.env["ir.config_parameter"]
+            .sudo()
+            .get_param("helpdesk_mgmt_project_domain.domain_cache", "False")
+        )
+
+    @tools.ormcache("key")
+    def _get_cached_source_domains(self, key, team, company):
+        return self._compute_source_domains(key[0], team, company)
+
+    def _compute_source_domains(self, kind, team=None, company=None):
+        """
+        Collect the domains to combine with AND:
           1) Company global domain (base filter)
           2) Team static domain (always AND with company)
           3) Team Python code (always AND with company + team)
         """
-        # Allow usage without ensure_one() (e.g., view fallback)
-        team = team or (self.team_id if self else None)
-        company = company or (self.company_id if self else self.env.company)
-
-        # Collect all domains to combine
         domains = []
 
         # 1) Company global domain (base filter)
-        if company and getattr(company, "helpdesk_mgmt_project_domain", False):
+        if company and company[f"helpdesk_mgmt_{kind}_domain"]:
             company_domain = self._safe_eval_domain_text(
-                company.helpdesk_mgmt_project_domain
+                company[f"helpdesk_mgmt_{kind}_domain"]
             )
             if company_domain:
                 domains.append(company_domain)
 
         # 2) Team static domain (always AND with company)
-        if team and getattr(team, "project_domain", False):
-            team_domain = self._safe_eval_domain_text(team.project_domain)
+        if team and team[f"{kind}_domain"]:
+            team_domain = self._safe_eval_domain_text(team[f"{kind}_domain"])
             if team_domain:
                 domains.append(team_domain)
 
         # 3) Team Python code (always AND with company + team)
-        if team and getattr(team, "project_domain_python", False):
-            python_domain = self._run_python_domain(team.project_domain_python)
+        if team and team[f"{kind}_domain_python"]:
+            python_domain = self._run_team_python_domain(team, kind)
             if python_domain:
                 domains.append(python_domain)
 
+        return tuple(tuple(domain) for domain in domains)
+
+    @api.model
+    def _get_python_domain_budget(self):
+        """Return the time (ms) and query budgets of domain Python code."""
+        get_param = self.env["ir.config_parameter"].sudo().get_param
+        return (
+            int(get_param("helpdesk_mgmt_project_domain.python_time_budget", 200)),
+            int(get_param("helpdesk_mgmt_project_domain.python_query_budget", 50)),
+        )
+
+    def _run_team_python_domain(self, team, kind):
+        """Run the domain Python code of ``team`` within the configured budgets.
+
+        Python code cannot be interrupted safely, so the budgets are checked
+        once the code has run: the domain of an evaluation exceeding them is
+        dropped and only the static domains apply. Every evaluation is
+        accounted in the statistics of the team.
+        """
+        time_budget, query_budget = self._get_python_domain_budget()
+        cr = self.env.cr
+        start_query_count = cr.sql_log_count
+        start = time.perf_counter()
+        domain = self._run_python_domain(team[f"{kind}_domain_python"])
+        duration = (time.perf_counter() - start) * 1000
+        query_count = cr.sql_log_count - start_query_count
+        overrun = (time_budget > 0 and duration > time_budget) or (
+            query_budget > 0 and query_count > query_budget
+        )
+        self.env["helpdesk.ticket.team.domain.stat"]._add(
+            team, kind, duration, query_count, overrun
+        )
+        if overrun:
+            _logger.warning(
+                "%s domain Python code of team %s exceeded its budget "
+                "(%.1f ms, %d queries), falling back to the static domains",
+                kind.capitalize(),
+                team.display_name,
+                duration,
+                query_count,
+            )
+            return []
+        return domain
+
+    @api.model
+    def _invalidate_domain_memo(self):
+        """Drop memoized domains after a change of the domain rules."""
+        self.env.cr.precommit.data.pop(DOMAIN_MEMO_KEY, None)
+        self.env.registry.clear_cache()
+
+    def _compute_project_domain_from_sources(self, team=None, company=None):
+        """
+        Simplified logic - all domains are combined with AND:
+          1) Company global domain (base filter)
+          2) Team static domain (always AND with company)
+          3) Team Python code (always AND with company + team)
+        """
+        # Allow usage without ensure_one() (e.g., view fallback)
+        team = team or (self.team_id if self else None)
+        company = company or (self.company_id if self else self.env.company)
+
+        domains = self._get_source_domains("project", team=team, company=company)
+
         # Combine all domains with AND
         if domains:
             return expression.AND(domains)
@@ -279,28 +448,7 @@ class HelpdeskTicket(models.Model):
         team = team or (self.team_id if self else None)
         company = company or (self.company_id if self else self.env.company)
 
-        # Collect all domains to combine
-        domains = []
-
-        # 1) Company global domain (base filter)
-        if company and getattr(company, "helpdesk_mgmt_task_domain", False):
-            company_domain = self._safe_eval_domain_text(
-                company.helpdesk_mgmt_task_domain
-            )
-            if company_domain:
-                domains.append(company_domain)
-
-        # 2) Team static domain (always AND with company)
-        if team and getattr(team, "task_domain", False):
-            team_domain = self._safe_eval_domain_text(team.task_domain)
-            if team_domain:
-                domains.append(team_domain)
-
-        # 3) Team Python code (always AND with company + team)
-        if team and getattr(team, "task_domain_python", False):
-            python_domain = self._run_python_domain(team.task_domain_python)
-            if python_domain:
-                domains.append(python_domain)
+        domains = self._get_source_domains("task", team=team, company=company)
 
         # 4) Project filter - filter tasks by selected project
         # Only add project filter if not already present in any domain
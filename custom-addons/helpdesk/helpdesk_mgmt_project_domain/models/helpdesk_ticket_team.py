@@ -42,6 +42,13 @@ DEFAULT_TASK_PYTHON_CODE = """# Available variables:
 
 """
 
+DOMAIN_FIELDS = {
+    "project_domain",
+    "project_domain_python",
+    "task_domain",
+    "task_domain_python",
+}
+
 
 class HelpdeskTicketTeam(models.Model):
     _inherit = "helpdesk.ticket.team"
@@ -78,6 +85,87 @@ class HelpdeskTicketTeam(models.Model):
         "Available variables: ticket, env, user, company, AND, OR, normalize.",
     )
 
+    project_domain_eval_count = fields.Integer(
+        string="Project Code Evaluations", compute="_compute_domain_stats"
+    )
+    project_domain_avg_duration = fields.Float(
+        string="Project Code Average Duration (ms)", compute="_compute_domain_stats"
+    )
+    project_domain_max_duration = fields.Float(
+        string="Project Code Max Duration (ms)", compute="_compute_domain_stats"
+    )
+    project_domain_avg_query_count = fields.Float(
+        string="Project Code Average Queries", compute="_compute_domain_stats"
+    )
+    project_domain_overrun_count = fields.Integer(
+        string="Project Code Budget Overruns", compute="_compute_domain_stats"
+    )
+    task_domain_eval_count = fields.Integer(
+        string="Task Code Evaluations", compute="_compute_domain_stats"
+    )
+    task_domain_avg_duration = fields.Float(
+        string="Task Code Average Duration (ms)", compute="_compute_domain_stats"
+    )
+    task_domain_max_duration = fields.Float(
+        string="Task Code Max Duration (ms)", compute="_compute_domain_stats"
+    )
+    task_domain_avg_query_count = fields.Float(
+        string="Task Code Average Queries", compute="_compute_domain_stats"
+    )
+    task_domain_overrun_count = fields.Integer(
+        string="Task Code Budget Overruns", compute="_compute_domain_stats"
+    )
+
+    def _compute_domain_stats(self):
+        stats = {
+            (team.id, kind): values
+            for team, kind, *values in self.env["helpdesk.ticket.team.domain.stat"]
+            .sudo()
+            ._read_group(
+                [("team_id", "in", self.ids)],
+                ["team_id", "kind"],
+                [
+                    "eval_count:sum",
+                    "duration:sum",
+                    "max_duration:max",
+                    "query_count:sum",
+                    "overrun_count:sum",
+                ],
+            )
+        }
+        for team in self:
+            for kind in ("project", "task"):
+                count, duration, max_duration, query_count, overrun_count = stats.get(
+                    (team.id, kind), (0, 0.0, 0.0, 0, 0)
+                )
+                team[f"{kind}_domain_eval_count"] = count
+                team[f"{kind}_domain_avg_duration"] = duration / count if count else 0.0
+                team[f"{kind}_domain_max_duration"] = max_duration
+                team[f"{kind}_domain_avg_query_count"] = (
+                    query_count / count if count else 0.0
+                )
+                team[f"{kind}_domain_overrun_count"] = overrun_count
+
+    def write(self, vals):
+        res = super().write(vals)
+        if DOMAIN_FIELDS.intersection(vals):
+            self.env["helpdesk.ticket"]._invalidate_domain_memo()
+        # Statistics of the previous code are meaningless for the new one
+        kinds = [
+            kind for kind in ("project", "task") if f"{kind}_domain_python" in vals
+        ]
+        if kinds:
+            self._reset_domain_stats(kinds)
+        return res
+
+    def _reset_domain_stats(self, kinds=("project", "task")):
+        self.env["helpdesk.ticket.team.domain.stat"].sudo().search(
+            [("team_id", "in", self.ids), ("kind", "in", list(kinds))]
+        ).unlink()
+
+    def action_reset_domain_stats(self):
+        self._reset_domain_stats()
+
     @api.constrains("project_domain_python", "task_domain_python")
     def _check_python_code(self):
         """Validate Python domain code syntax and security using Odoo's native tools"""
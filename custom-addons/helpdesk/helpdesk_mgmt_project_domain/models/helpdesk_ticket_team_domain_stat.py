@@ -0,0 +1,85 @@
+# Copyright 2025 Marcel Savegnago - https://www.escodoo.com.br
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+
+import logging
+from datetime import timedelta
+
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+STATS_KEY = "helpdesk_mgmt_project_domain.stats"
+
+
+class HelpdeskTicketTeamDomainStat(models.Model):
+    _name = "helpdesk.ticket.team.domain.stat"
+    _description = "Helpdesk Team Domain Python Code Statistics"
+    _order = "date desc, id desc"
+    _log_access = False
+
+    team_id = fields.Many2one(
+        comodel_name="helpdesk.ticket.team",
+        required=True,
+        ondelete="cascade",
+        index=True,
+    )
+    kind = fields.Selection(
+        selection=[("project", "Project"), ("task", "Task")],
+        required=True,
+    )
+    date = fields.Datetime(required=True, index=True)
+    eval_count = fields.Integer(string="Evaluations")
+    duration = fields.Float(string="Total Duration (ms)")
+    max_duration = fields.Float(string="Max Duration (ms)", group_operator="max")
+    query_count = fields.Integer(string="SQL Queries")
+    overrun_count = fields.Integer(string="Budget Overruns")
+
+    @api.model
+    def _add(self, team, kind, duration, query_count, overrun):
+        """Account an evaluation of the domain Python code of ``team``.
+
+        Statistics are accumulated in the transaction and inserted at commit,
+        as new rows, so concurrent ticket forms never update the same row.
+        """
+        precommit = self.env.cr.precommit
+        stats = precommit.data.get(STATS_KEY)
+        if stats is None:
+            stats = precommit.data[STATS_KEY] = {}
+            precommit.add(self._flush)
+        stat = stats.setdefault((team.id, kind), [0, 0.0, 0.0, 0, 0])
+        stat[0] += 1
+        stat[1] += duration
+        stat[2] = max(stat[2], duration)
+        stat[3] += query_count
+        stat[4] += int(bool(overrun))
+
+    @api.model
+    def _flush(self):
+        stats = self.env.cr.precommit.data.pop(STATS_KEY, {})
+        now = fields.Datetime.now()
+        for (team_id, kind), stat in stats.items():
+            self.env.cr.execute(
+                """
+                INSERT INTO helpdesk_ticket_team_domain_stat (
+                    team_id, kind, date, eval_count, duration, max_duration,
+                    query_count, overrun_count
+                )
+                SELECT %s, %s, %s, %s, %s, %s, %s, %s
+                WHERE EXISTS (SELECT 1 FROM helpdesk_ticket_team WHERE id = %s)
+                """,
+                (team_id, kind, now, *stat, team_id),
+            )
+
+    @api.autovacuum
+    def _gc_domain_stats(self):
+        retention_days = int(
+            self.env["ir.config_parameter"]
+            .sudo()
+            .get_param("helpdesk_mgmt_project_domain.stat_retention_days", 30)
+        )
+        if retention_days <= 0:
+            return
+        limit_date = fields.Datetime.now() - timedelta(days=retention_days)
+        stats = self.sudo().search([("date", "<", limit_date)])
+        stats.unlink()
+        _logger.info("GC'd %d helpdesk team domain statistics", len(stats))
@@ -20,3 +20,11 @@ class ResCompany(models.Model):
         "This will be applied if no specific domain is set in the team. "
         "Example: [('active', '=', True), ('project_id', '!=', False)]",
     )
+
+    def write(self, vals):
+        res = super().write(vals)
+        if {"helpdesk_mgmt_project_domain", "helpdesk_mgmt_task_domain"}.intersection(
+            vals
+        ):
+            self.env["helpdesk.ticket"]._invalidate_domain_memo()
+        return res
@@ -24,3 +24,28 @@ class ResConfigSettings(models.TransientModel):
         "This will be applied if no specific domain is set in the team. "
         "Example: [('active', '=', True), ('project_id', '!=', False)]",
     )
+
+    helpdesk_mgmt_project_domain_cache = fields.Boolean(
+        string="Cache Project & Task Domains",
+        config_parameter="helpdesk_mgmt_project_domain.domain_cache",
+        help="Keep the project and task domains computed for a ticket context "
+        "across requests. Only enable it when the team Python code depends on "
+        "the ticket fields it reads, not on other data of the database.",
+    )
+
+    helpdesk_mgmt_project_domain_python_time_budget = fields.Integer(
+        string="Domain Python Code Time Budget (ms)",
+        config_parameter="helpdesk_mgmt_project_domain.python_time_budget",
+        default=200,
+        help="Team domain Python code running longer than this is ignored for "
+        "the evaluation, only the static domains apply. Use 0 for no limit.",
+    )
+
+    helpdesk_mgmt_project_domain_python_query_budget = fields.Integer(
+        string="Domain Python Code Query Budget",
+        config_parameter="helpdesk_mgmt_project_domain.python_query_budget",
+        default=50,
+        help="Team domain Python code running more SQL queries than this is "
+        "ignored for the evaluation, only the static domains apply. "
+        "Use 0 for no limit.",
+    )
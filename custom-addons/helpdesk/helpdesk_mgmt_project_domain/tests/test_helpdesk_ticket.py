@@ -4,6 +4,9 @@
 from odoo.osv import expression
 
 from odoo.addons.helpdesk_mgmt.tests.common import TestHelpdeskTicketBase
+from odoo.addons.helpdesk_mgmt_project_domain.models.helpdesk_ticket import (
+    DOMAIN_MEMO_KEY,
+)
 
 
 class TestHelpdeskProjectDomain(TestHelpdeskTicketBase):
@@ -295,8 +298,8 @@ domain = [('name', 'ilike', 'Project')]
         )
         self.assertEqual(domain, expected)
 
-    def test_compute_project_domain_ids(self):
-        """Test the computed field project_domain_ids"""
+    def test_compute_project_id_domain(self):
+        """Test the computed field project_id_domain"""
         # Clear company domain first
         self.company.helpdesk_mgmt_project_domain = False
 
@@ -312,9 +315,13 @@ domain = [('name', 'ilike', 'Project')]
             }
         )
 
-        # Check computed field
-        self.assertIn(self.project_1, ticket.project_domain_ids)
-        self.assertNotIn(self.project_2, ticket.project_domain_ids)
+        # Check computed field holds the domain, not the matching projects
+        self.assertEqual(ticket.project_id_domain, [("active", "=", True)])
+        projects = self.env["project.project"].search(
+            ticket.project_id_domain, limit=8
+        )
+        self.assertIn(self.project_1, projects)
+        self.assertNotIn(self.project_2, projects)
 
     def test_get_project_domain_for_view(self):
         """Test the _get_project_domain_for_view method"""
@@ -497,8 +504,8 @@ else:
         domain = ticket._get_task_domain()
         self.assertEqual(domain, [("id", "=", 0)])
 
-    def test_compute_task_domain_ids(self):
-        """Test computed field for task domain IDs"""
+    def test_compute_task_id_domain(self):
+        """Test computed field for task domain"""
         # Clear company domain first
         self.company.helpdesk_mgmt_task_domain = False
 
@@ -528,9 +535,11 @@ else:
             }
         )
 
-        # Check computed field
-        self.assertIn(task1, ticket.task_domain_ids)
-        self.assertNotIn(task2, ticket.task_domain_ids)
+        # Check computed field holds the domain, not the matching tasks
+        self.assertEqual(ticket.task_id_domain, [("active", "=", True)])
+        tasks = self.env["project.task"].search(ticket.task_id_domain)
+        self.assertIn(task1, tasks)
+        self.assertNotIn(task2, tasks)
 
     def test_get_task_domain_for_view(self):
         """Test _get_task_domain_for_view method"""
@@ -971,3 +980,103 @@ else:
         )
         expected = {"domain": {"task_id": expected_domain}}
         self.assertEqual(result, expected)
+
+    def test_python_domain_code_checked_once(self):
+        """Test domain Python code is checked once and reused per ticket"""
+        self.company.helpdesk_mgmt_project_domain = False
+        self.team.project_domain_python = (
+            "[('partner_id', '=', ticket.partner_id.id)] "
+            "if ticket.partner_id else [('active', '=', True)]"
+        )
+        partner = self.env["res.partner"].create({"name": "Test Partner"})
+        Ticket = self.env["helpdesk.ticket"]
+        ticket_1 = Ticket.create(
+            {
+                "name": "Test Ticket 1",
+                "description": "Test ticket description",
+                "team_id": self.team.id,
+                "partner_id": partner.id,
+            }
+        )
+        ticket_2 = Ticket.create(
+            {
+                "name": "Test Ticket 2",
+                "description": "Test ticket description",
+                "team_id": self.team.id,
+            }
+        )
+        self.assertEqual(
+            Ticket._get_python_domain_mode(self.team.project_domain_python), "eval"
+        )
+        # The same code gives each ticket its own domain
+        self.assertEqual(
+            ticket_1._get_project_domain(), [("partner_id", "=", partner.id)]
+        )
+        self.assertEqual(ticket_2._get_project_domain(), [("active", "=", True)])
+        # Editing the code is picked up immediately
+        self.team.project_domain_python = "domain = [('active', '=', False)]"
+        self.assertEqual(
+            Ticket._get_python_domain_mode(self.team.project_domain_python), "exec"
+        )
+        self.assertEqual(ticket_1._get_project_domain(), [("active", "=", False)])
+
+    def test_python_domain_paths(self):
+        """Test detection of the ticket fields read by domain Python code"""
+        Ticket = self.env["helpdesk.ticket"]
+        self.assertEqual(
+            Ticket._get_python_domain_paths(
+                "domain = [('partner_id', '=', ticket.partner_id.id)] "
+                "if ticket.priority == '3' else []"
+            ),
+            ("partner_id.id", "priority"),
+        )
+        self.assertEqual(Ticket._get_python_domain_paths("domain = []"), ())
+        self.assertIsNone(
+            Ticket._get_python_domain_paths("domain = [('id', 'in', ticket.ids)]")
+        )
+
+    def test_domain_memo_shared_by_ticket_context(self):
+        """Test tickets reading the same values share the memoized domain"""
+        self.company.helpdesk_mgmt_project_domain = "[('active', '=', True)]"
+        self.team.project_domain_python = (
+            "domain = [('partner_id', '=', ticket.partner_id.id)]"
+        )
+        partner_1 = self.env["res.partner"].create({"name": "Partner 1"})
+        partner_2 = self.env["res.partner"].create({"name": "Partner 2"})
+        tickets = self.env["helpdesk.ticket"].create(
+            [
+                {
+                    "name": f"Test Ticket {partner.name}",
+                    "description": "Test ticket description",
+                    "team_id": self.team.id,
+                    "partner_id": partner.id,
+                    "priority": priority,
+                }
+                for partner, priority in [
+                    (partner_1, "0"),
+                    (partner_1, "3"),
+                    (partner_2, "0"),
+                ]
+            ]
+        )
+        self.env.cr.precommit.data.pop(DOMAIN_MEMO_KEY, None)
+        domains = [ticket._get_project_domain() for ticket in tickets]
+        self.assertEqual(domains[0], domains[1])
+        self.assertEqual(
+            domains[2],
+            expression.AND(
+                [[("active", "=", True)], [("partner_id", "=", partner_2.id)]]
+            ),
+        )
+        # The priority is not read by the rules, both partners are
+        self.assertEqual(len(self.env.cr.precommit.data[DOMAIN_MEMO_KEY]), 2)
+
+        # Changing a domain rule drops the memo
+        self.company.helpdesk_mgmt_project_domain = "[('active', '=', False)]"
+        self.assertNotIn(DOMAIN_MEMO_KEY, self.env.cr.precommit.data)
+        self.assertEqual(
+            tickets[0]._get_project_domain(),
+            expression.AND(
+                [[("active", "=", False)], [("partner_id", "=", partner_1.id)]]
+            ),
+        )
@@ -411,3 +411,57 @@ domain = normalize([domain1, domain2])
             }
         )
         self.team._check_python_code()
+
+    def _create_domain_ticket(self):
+        return self.env["helpdesk.ticket"].create(
+            {
+                "name": "Test Ticket",
+                "description": "Test ticket description",
+                "team_id": self.team.id,
+            }
+        )
+
+    def test_python_code_statistics(self):
+        """Test evaluations of the Python code are accounted on the team"""
+        self.company.helpdesk_mgmt_project_domain = False
+        self.team.write(
+            {
+                "project_domain": False,
+                "project_domain_python": "domain = [('active', '=', True)]",
+            }
+        )
+        ticket = self._create_domain_ticket()
+        self.assertEqual(ticket._get_project_domain(), [("active", "=", True)])
+        self.env["helpdesk.ticket.team.domain.stat"]._flush()
+        self.team.invalidate_recordset()
+        self.assertEqual(self.team.project_domain_eval_count, 1)
+        self.assertEqual(self.team.project_domain_overrun_count, 0)
+        self.assertEqual(self.team.task_domain_eval_count, 0)
+
+        self.team.action_reset_domain_stats()
+        self.team.invalidate_recordset()
+        self.assertEqual(self.team.project_domain_eval_count, 0)
+
+    def test_python_code_query_budget(self):
+        """Test Python code exceeding its query budget falls back to static"""
+        config = self.env["ir.config_parameter"].sudo()
+        config.set_param("helpdesk_mgmt_project_domain.python_time_budget", 0)
+        config.set_param("helpdesk_mgmt_project_domain.python_query_budget", 1)
+        self.company.helpdesk_mgmt_project_domain = False
+        self.team.write(
+            {
+                "project_domain": "[('active', '=', True)]",
+                "project_domain_python": """
+for project_id in range(3):
+    env['project.project'].search([('id', '=', project_id)])
+domain = [('partner_id', '!=', False)]
+""",
+            }
+        )
+        ticket = self._create_domain_ticket()
+        self.assertEqual(ticket._get_project_domain(), [("active", "=", True)])
+        self.env["helpdesk.ticket.team.domain.stat"]._flush()
+        self.team.invalidate_recordset()
+        self.assertEqual(self.team.project_domain_eval_count, 1)
+        self.assertEqual(self.team.project_domain_overrun_count, 1)
+        self.assertGreaterEqual(self.team.project_domain_avg_query_count, 3)
@@ -8,33 +8,42 @@ from odoo.exceptions import ValidationError
 class HelpdeskTicket(models.Model):
     _inherit = "helpdesk.ticket"
 
-    def _check_ticket_has_empty_fields(self):
-        self.ensure_one()
-        error_message = False
-        field_ids = self.stage_id.validate_field_ids
-        field_names = [x.name for x in field_ids]
-        values = self.read(field_names)
+    def _get_empty_fields_error_message(self, validate_fields, values):
         fields = [
-            field.field_description for field in field_ids if not values[0][field.name]
+            description for name, description in validate_fields if not values[name]
         ]
         fields = ", ".join(fields)
         if fields:
-            error_message = _(
+            return _(
                 "Ticket %(ticket)s can't be moved to the stage %(stage)s until "
                 "the following fields are set: %(fields)s.",
                 ticket=self.name,
                 stage=self.stage_id.name,
                 fields=fields,
             )
-        return error_message
+        return False
+
+    def _check_ticket_has_empty_fields(self):
+        self.ensure_one()
+        messages = self._validate_stage_fields_error_message()
+        return messages[0] if messages else False
 
     def _validate_stage_fields_error_message(self):
-        error_message = []
-        for record in self:
-            message = record._check_ticket_has_empty_fields()
-            if message:
-                error_message.append(message)
-        return error_message
+        # Tickets are validated per stage, reading the fields of all the
+        # tickets of a stage at once
+        messages = {}
+        for stage, tickets in self.grouped("stage_id").items():
+            validate_fields = stage._get_validate_fields() if stage else ()
+            if not validate_fields:
+                continue
+            field_names = [name for name, _description in validate_fields]
+            for record, values in zip(tickets, tickets.read(field_names)):
+                message = record._get_empty_fields_error_message(
+                    validate_fields, values
+                )
+                if message:
+                    messages[record] = message
+        return [messages[record] for record in self if record in messages]
 
     @api.constrains("stage_id")
     def _validate_stage_fields(self):
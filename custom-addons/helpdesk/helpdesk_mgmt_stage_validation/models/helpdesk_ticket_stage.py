@@ -1,7 +1,7 @@
 # Copyright 2022 Camptocamp SA
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
 
-from odoo import fields, models
+from odoo import api, fields, models, tools
 
 
 class HelpdeskTicketStage(models.Model):
@@ -13,3 +13,22 @@ class HelpdeskTicketStage(models.Model):
         help="Select fields which must be set on the document in this stage",
         domain=[("model", "=", "helpdesk.ticket")],
     )
+
+    def _get_validate_fields(self):
+        """Return the ``(name, description)`` of the fields to validate."""
+        self.ensure_one()
+        return self._get_validate_fields_by_stage(self.id)
+
+    @api.model
+    @tools.ormcache("stage_id", "self.env.lang")
+    def _get_validate_fields_by_stage(self, stage_id):
+        return tuple(
+            (field.name, field.field_description)
+            for field in self.browse(stage_id).sudo().validate_field_ids
+        )
+
+    def write(self, vals):
+        res = super().write(vals)
+        if "validate_field_ids" in vals:
+            self.env.registry.clear_cache()
+        return res
@@ -65,3 +65,30 @@ class TestHelpdeskStageValidation(TransactionCase):
         self.ticket.write({"assigned_date": fields.datetime.now()})
         self.ticket.write({"stage_id": self.stage_ticket_assigned.id})
         self.assertEqual(self.ticket.stage_id, self.stage_ticket_assigned)
+
+    def test_helpdesk_ticket_stage_validation_bulk(self):
+        tickets = self.helpdesk_ticket.create(
+            [
+                {
+                    "name": f"Helpdesk Ticket {i}",
+                    "description": "Helpdesk Ticket Description",
+                    "stage_id": self.stage_ticket_default.id,
+                }
+                for i in range(3)
+            ]
+        )
+        tickets[1].assigned_date = fields.datetime.now()
+        messages = [
+            self.get_validate_message(ticket, self.stage_ticket_assigned)
+            for ticket in tickets
+        ]
+        self.assertFalse(messages[1])
+        with self.assertRaises(ValidationError) as error:
+            tickets.write({"stage_id": self.stage_ticket_assigned.id})
+        self.assertEqual(
+            error.exception.args[0], "\n".join([messages[0], messages[2]])
+        )
+        # The fields to validate of the stage are reloaded when changed
+        self.stage_ticket_assigned.validate_field_ids = False
+        tickets.write({"stage_id": self.stage_ticket_assigned.id})
+        self.assertEqual(tickets.stage_id, self.stage_ticket_assigned)
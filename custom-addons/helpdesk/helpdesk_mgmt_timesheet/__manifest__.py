@@ -15,17 +15,20 @@
     "website": "https://github.com/OCA/helpdesk",
     "license": "AGPL-3",
     "category": "After-Sales",
-    "version": "17.0.1.0.4",
+    "version": "17.0.1.4.3",
     "depends": [
         "helpdesk_mgmt_project",
         "hr_timesheet",
         "project_timesheet_time_control",
     ],
     "data": [
+        "security/ir.model.access.csv",
+        "security/helpdesk_mgmt_timesheet_security.xml",
         "views/helpdesk_team_view.xml",
         "views/helpdesk_ticket_view.xml",
         "views/hr_timesheet_view.xml",
         "views/helpdesk_project_task_view.xml",
+        "views/helpdesk_ticket_timesheet_daily_views.xml",
         "report/report_timesheet_templates.xml",
     ],
     "demo": ["demo/helpdesk_mgmt_timesheet_demo.xml"],
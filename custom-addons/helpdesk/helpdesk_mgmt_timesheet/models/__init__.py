@@ -4,3 +4,4 @@
 from . import hr_timesheet
 from . import helpdesk_ticket
 from . import helpdesk_ticket_team
+from . import helpdesk_ticket_timesheet_daily
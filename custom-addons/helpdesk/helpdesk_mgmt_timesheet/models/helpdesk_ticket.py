@@ -33,23 +33,90 @@ class HelpdeskTicket(models.Model):
         string="Timesheet",
     )
     total_hours = fields.Float(
-        compute="_compute_total_hours", readonly=True, store=True
+        compute="_compute_timesheet_totals", readonly=True, store=True
     )
     last_timesheet_activity = fields.Date(
-        compute="_compute_last_timesheet_activity",
+        compute="_compute_timesheet_totals",
         readonly=True,
         store=True,
     )
 
-    @api.depends("timesheet_ids.unit_amount")
-    def _compute_total_hours(self):
+    @api.depends("timesheet_ids.unit_amount", "timesheet_ids.date")
+    def _compute_timesheet_totals(self):
+        if not any(self._ids):
+            for record in self:
+                record.total_hours = sum(record.timesheet_ids.mapped("unit_amount"))
+                record.last_timesheet_activity = max(
+                    record.timesheet_ids.mapped("date"), default=False
+                )
+            return
+        totals = {
+            ticket.id: (unit_amount, date)
+            for ticket, unit_amount, date in self.env["account.analytic.line"]
+            .sudo()
+            ._read_group(
+                [("ticket_id", "in", self.ids)],
+                ["ticket_id"],
+                ["unit_amount:sum", "date:max"],
+            )
+        }
         for record in self:
-            record.total_hours = sum(record.timesheet_ids.mapped("unit_amount"))
+            record.total_hours, record.last_timesheet_activity = totals.get(
+                record.id, (0.0, False)
+            )
 
-    @api.constrains("project_id")
-    def _constrains_project_timesheets(self):
-        for record in self:
-            record.timesheet_ids.update({"project_id": record.project_id.id})
+    @api.model_create_multi
+    def create(self, vals_list):
+        tickets = super().create(vals_list)
+        # Timesheet lines created along with the tickets follow their project
+        if any(vals.get("timesheet_ids") for vals in vals_list):
+            tickets._propagate_project_to_timesheets()
+        return tickets
+
+    def write(self, vals):
+        res = super().write(vals)
+        if "project_id" in vals:
+            self._propagate_project_to_timesheets()
+        if "partner_id" in vals:
+            self._propagate_partner_to_timesheets()
+        return res
+
+    def _propagate_project_to_timesheets(self):
+        """Move the timesheet lines of the tickets to the ticket project.
+
+        The lines are written once per project rather than once per ticket,
+        through the ORM so that the timesheet business logic still applies.
+        """
+        AnalyticLine = self.env["account.analytic.line"]
+        for project, tickets in self.grouped("project_id").items():
+            lines = AnalyticLine.search(
+                [("ticket_id", "in", tickets.ids), ("project_id", "!=", project.id)]
+            )
+            if lines:
+                lines.write({"project_id": project.id})
+
+    def _propagate_partner_to_timesheets(self):
+        """Copy the partner of the tickets on their timesheet lines in SQL."""
+        if not self:
+            return
+        self.flush_recordset(["partner_id"])
+        AnalyticLine = self.env["account.analytic.line"]
+        AnalyticLine.flush_model(["ticket_id", "ticket_partner_id"])
+        self.env.cr.execute(
+            """
+            UPDATE account_analytic_line line
+               SET ticket_partner_id = ticket.partner_id
+              FROM helpdesk_ticket ticket
+             WHERE line.ticket_id = ticket.id
+               AND ticket.id IN %s
+               AND line.ticket_partner_id IS DISTINCT FROM ticket.partner_id
+         RETURNING line.id
+            """,
+            [tuple(self.ids)],
+        )
+        lines = AnalyticLine.browse(row[0] for row in self.env.cr.fetchall())
+        lines.invalidate_recordset(["ticket_partner_id"])
+        lines.modified(["ticket_partner_id"])
 
     @api.onchange("team_id")
     def _onchange_team_id(self):
@@ -69,14 +136,6 @@ class HelpdeskTicket(models.Model):
                     )
             ticket.remaining_hours = ticket.planned_hours - ticket.total_hours
 
-    @api.depends("timesheet_ids.date")
-    def _compute_last_timesheet_activity(self):
-        for record in self:
-            record.last_timesheet_activity = (
-                record.timesheet_ids
-                and record.timesheet_ids.sorted(key="date", reverse=True)[0].date
-            ) or False
-
     @api.depends(
         "team_id.allow_timesheet",
         "project_id.allow_timesheets",
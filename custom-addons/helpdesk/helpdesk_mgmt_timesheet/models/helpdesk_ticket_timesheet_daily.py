@@ -0,0 +1,115 @@
+###############################################################################
+# For copyright and license notices, see __manifest__.py file in root directory
+###############################################################################
+from odoo import api, fields, models
+
+
+class HelpdeskTicketTimesheetDaily(models.Model):
+    """Hours spent per ticket, employee and day.
+
+    Rolled up from the timesheet lines of the tickets, so that reports over
+    long periods read one row per ticket, employee and day instead of every
+    timesheet line. The rows are kept up to date by the timesheet lines.
+    """
+
+    _name = "helpdesk.ticket.timesheet.daily"
+    _description = "Helpdesk Ticket Daily Timesheet"
+    _order = "date desc, ticket_id, employee_id"
+    _log_access = False
+    _rec_name = "ticket_id"
+
+    ticket_id = fields.Many2one(
+        comodel_name="helpdesk.ticket",
+        string="Ticket",
+        required=True,
+        readonly=True,
+        ondelete="cascade",
+    )
+    employee_id = fields.Many2one(
+        comodel_name="hr.employee",
+        string="Employee",
+        required=True,
+        readonly=True,
+        ondelete="cascade",
+        index=True,
+    )
+    date = fields.Date(required=True, readonly=True, index=True)
+    unit_amount = fields.Float(string="Hours Spent", readonly=True)
+    partner_id = fields.Many2one(
+        related="ticket_id.partner_id", string="Ticket partner", store=True
+    )
+    team_id = fields.Many2one(related="ticket_id.team_id", store=True)
+    company_id = fields.Many2one(related="ticket_id.company_id", store=True)
+
+    _sql_constraints = [
+        (
+            "ticket_employee_date_uniq",
+            "unique(ticket_id, employee_id, date)",
+            "Only one daily timesheet per ticket, employee and day.",
+        ),
+    ]
+
+    def init(self):
+        self.env.cr.execute(f"SELECT 1 FROM {self._table} LIMIT 1")
+        if not self.env.cr.rowcount:
+            self._rollup()
+
+    @api.model
+    def _rollup(self, keys=None):
+        """Recompute the daily hours of ``keys`` from the timesheet lines.
+
+        :param keys: iterable of ``(ticket_id, employee_id, date)`` tuples,
+            all the timesheet lines of the tickets are rolled up when omitted
+        """
+        if keys is not None:
+            keys = {key for key in keys if all(key)}
+            if not keys:
+                return
+        self.env["account.analytic.line"].flush_model(
+            ["ticket_id", "employee_id", "date", "unit_amount"]
+        )
+        self.env["helpdesk.ticket"].flush_model(
+            ["partner_id", "team_id", "company_id"]
+        )
+        line_query = daily_query = "TRUE"
+        params = []
+        if keys is not None:
+            line_query = "(line.ticket_id, line.employee_id, line.date) IN %s"
+            daily_query = "(daily.ticket_id, daily.employee_id, daily.date) IN %s"
+            params = [tuple(keys)]
+        # Drop the days left without any timesheet line
+        self.env.cr.execute(
+            f"""
+            DELETE FROM {self._table} daily
+             WHERE NOT EXISTS (
+                    SELECT 1
+                      FROM account_analytic_line line
+                     WHERE line.ticket_id = daily.ticket_id
+                       AND line.employee_id = daily.employee_id
+                       AND line.date = daily.date
+                   )
+               AND {daily_query}
+            """,
+            params,
+        )
+        self.env.cr.execute(
+            f"""
+            INSERT INTO {self._table} (
+                ticket_id, employee_id, date, unit_amount,
+                partner_id, team_id, company_id
+            )
+            SELECT line.ticket_id, line.employee_id, line.date,
+                   SUM(line.unit_amount),
+                   ticket.partner_id, ticket.team_id, ticket.company_id
+              FROM account_analytic_line line
+              JOIN helpdesk_ticket ticket ON ticket.id = line.ticket_id
+             WHERE {line_query}
+               AND line.employee_id IS NOT NULL
+          GROUP BY line.ticket_id, line.employee_id, line.date,
+                   ticket.partner_id, ticket.team_id, ticket.company_id
+                ON CONFLICT (ticket_id, employee_id, date)
+                DO UPDATE SET unit_amount = EXCLUDED.unit_amount
+            """,
+            params,
+        )
+        self.invalidate_model(["unit_amount"])
@@ -1,7 +1,10 @@
 ###############################################################################
 # For copyright and license notices, see __manifest__.py file in root directory
 ###############################################################################
-from odoo import api, fields, models
+from odoo import api, fields, models, tools
+
+# Fields of the timesheet lines rolled up in helpdesk.ticket.timesheet.daily
+DAILY_FIELDS = {"ticket_id", "employee_id", "date", "unit_amount"}
 
 
 class AccountAnalyticLine(models.Model):
@@ -11,15 +14,80 @@ class AccountAnalyticLine(models.Model):
         comodel_name="helpdesk.ticket",
         string="Ticket",
         domain=[("project_id", "!=", False)],
+        index="btree_not_null",
     )
     ticket_partner_id = fields.Many2one(
         comodel_name="res.partner",
-        related="ticket_id.partner_id",
         string="Ticket partner",
+        compute="_compute_ticket_partner_id",
         store=True,
         compute_sudo=True,
     )
 
+    # The partner of a ticket is copied on its lines by the ticket itself, in
+    # a single query, instead of depending on ``ticket_id.partner_id``.
+    @api.depends("ticket_id")
+    def _compute_ticket_partner_id(self):
+        for record in self:
+            record.ticket_partner_id = record.ticket_id.partner_id
+
+    def init(self):
+        super().init()
+        # Running timers of the tickets: only the few lines without duration
+        # yet are indexed, so the time control buttons do not depend on the
+        # number of lines of the tickets. The predicate must be implied by
+        # the queries of hr.timesheet.time_control.mixin, which filter on the
+        # ticket, the user and ``unit_amount = 0`` but not on ``date_time``.
+        tools.drop_index(
+            self.env.cr, "account_analytic_line_ticket_running_index", self._table
+        )
+        tools.create_index(
+            self.env.cr,
+            "account_analytic_line_ticket_timer_index",
+            self._table,
+            ["ticket_id", "user_id"],
+            where="ticket_id IS NOT NULL AND unit_amount = 0",
+        )
+        # Latest line of a user on a ticket, for the timer switch suggestion
+        tools.create_index(
+            self.env.cr,
+            "account_analytic_line_ticket_user_date_time_index",
+            self._table,
+            ["user_id", "ticket_id", "date_time DESC"],
+            where="ticket_id IS NOT NULL",
+        )
+
+    def _get_ticket_daily_keys(self):
+        return {
+            (line.ticket_id.id, line.employee_id.id, line.date)
+            for line in self
+            if line.ticket_id
+        }
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        lines = super().create(vals_list)
+        self.env["helpdesk.ticket.timesheet.daily"]._rollup(
+            lines._get_ticket_daily_keys()
+        )
+        return lines
+
+    def write(self, vals):
+        if not DAILY_FIELDS.intersection(vals):
+            return super().write(vals)
+        keys = self._get_ticket_daily_keys()
+        res = super().write(vals)
+        self.env["helpdesk.ticket.timesheet.daily"]._rollup(
+            keys | self._get_ticket_daily_keys()
+        )
+        return res
+
+    def unlink(self):
+        keys = self._get_ticket_daily_keys()
+        res = super().unlink()
+        self.env["helpdesk.ticket.timesheet.daily"]._rollup(keys)
+        return res
+
     @api.onchange("ticket_id")
     def onchange_ticket_id(self):
         for record in self:
@@ -4,7 +4,7 @@
 import logging
 from datetime import timedelta
 
-from odoo import fields
+from odoo import Command, fields
 
 from odoo.addons.helpdesk_mgmt.tests import test_helpdesk_ticket
 
@@ -88,3 +88,133 @@ class TestHelpdeskMgmtTimesheet(test_helpdesk_ticket.TestHelpdeskTicket):
         self.assertEqual(
             ticket.remaining_hours, ticket.planned_hours - ticket.total_hours
         )
+
+    def test_helpdesk_mgmt_timesheet_totals_batch(self):
+        tickets = self.generate_ticket() | self.generate_ticket()
+        tickets.write({"project_id": self.project_id.id})
+        today = fields.Date.today()
+        self.env["account.analytic.line"].create(
+            [
+                {
+                    "date": today - timedelta(days=days_ago),
+                    "name": "Test Timesheet",
+                    "unit_amount": unit_amount,
+                    "ticket_id": ticket.id,
+                    "project_id": self.project_id.id,
+                    "employee_id": self.empl_employee.id,
+                }
+                for ticket, days_ago, unit_amount in [
+                    (tickets[0], 3, 1.5),
+                    (tickets[0], 1, 2.0),
+                    (tickets[1], 2, 0.5),
+                ]
+            ]
+        )
+        self.assertEqual(tickets.mapped("total_hours"), [3.5, 0.5])
+        self.assertEqual(
+            tickets.mapped("last_timesheet_activity"),
+            [today - timedelta(days=1), today - timedelta(days=2)],
+        )
+        tickets[0].timesheet_ids.filtered(
+            lambda line: line.date == today - timedelta(days=1)
+        ).unlink()
+        self.assertEqual(tickets[0].total_hours, 1.5)
+        self.assertEqual(tickets[0].last_timesheet_activity, today - timedelta(days=3))
+
+    def test_helpdesk_mgmt_timesheet_propagation_batch(self):
+        tickets = self.generate_ticket() | self.generate_ticket()
+        tickets.write({"project_id": self.project_id.id})
+        lines = self.env["account.analytic.line"].create(
+            [
+                {
+                    "name": "Test Timesheet",
+                    "unit_amount": 1,
+                    "ticket_id": ticket.id,
+                    "project_id": self.project_id.id,
+                    "employee_id": self.empl_employee.id,
+                }
+                for ticket in tickets
+                for _i in range(2)
+            ]
+        )
+        self.assertFalse(lines.ticket_partner_id)
+        partner = self.env["res.partner"].create({"name": "Ticket Partner"})
+        tickets.write({"partner_id": partner.id})
+        self.assertEqual(lines.ticket_partner_id, partner)
+        project = self.env["project.project"].create({"name": "Project 2"})
+        tickets.write({"project_id": project.id})
+        self.assertEqual(lines.project_id, project)
+        # A new line gets the partner of its ticket
+        line = self.env["account.analytic.line"].create(
+            {
+                "name": "Test Timesheet",
+                "unit_amount": 1,
+                "ticket_id": tickets[1].id,
+                "project_id": project.id,
+                "employee_id": self.empl_employee.id,
+            }
+        )
+        self.assertEqual(line.ticket_partner_id, partner)
+
+    def test_helpdesk_mgmt_timesheet_propagation_empty(self):
+        tickets = self.env["helpdesk.ticket"]
+        partner = self.env["res.partner"].create({"name": "Ticket Partner"})
+        self.assertTrue(tickets.write({"partner_id": partner.id}))
+
+    def test_helpdesk_mgmt_timesheet_propagation_create(self):
+        other_project = self.env["project.project"].create({"name": "Project 2"})
+        ticket = self.env["helpdesk.ticket"].create(
+            {
+                "name": "Test Ticket",
+                "description": "Test ticket description",
+                "team_id": self.team_id.id,
+                "project_id": self.project_id.id,
+                "timesheet_ids": [
+                    Command.create(
+                        {
+                            "name": "Test Timesheet",
+                            "unit_amount": 1,
+                            "project_id": other_project.id,
+                            "employee_id": self.empl_employee.id,
+                        }
+                    )
+                ],
+            }
+        )
+        self.assertEqual(ticket.timesheet_ids.project_id, self.project_id)
+
+    def test_helpdesk_mgmt_timesheet_daily_rollup(self):
+        Daily = self.env["helpdesk.ticket.timesheet.daily"]
+        ticket = self.generate_ticket()
+        ticket.project_id = self.project_id
+        today = fields.Date.today()
+        lines = self.env["account.analytic.line"].create(
+            [
+                {
+                    "date": today,
+                    "name": "Test Timesheet",
+                    "unit_amount": unit_amount,
+                    "ticket_id": ticket.id,
+                    "project_id": self.project_id.id,
+                    "employee_id": self.empl_employee.id,
+                }
+                for unit_amount in (1.0, 2.5)
+            ]
+        )
+        daily = Daily.search([("ticket_id", "=", ticket.id)])
+        self.assertEqual(len(daily), 1)
+        self.assertEqual(daily.unit_amount, 3.5)
+        self.assertEqual(daily.employee_id, self.empl_employee)
+
+        lines[0].write({"date": today - timedelta(days=1)})
+        daily = Daily.search([("ticket_id", "=", ticket.id)])
+        self.assertEqual(daily.mapped("unit_amount"), [2.5, 1.0])
+
+        lines[1].unlink()
+        daily = Daily.search([("ticket_id", "=", ticket.id)])
+        self.assertEqual(daily.date, today - timedelta(days=1))
+        self.assertEqual(daily.unit_amount, 1.0)
+
+        partner = self.env["res.partner"].create({"name": "Ticket Partner"})
+        ticket.partner_id = partner
+        self.assertEqual(daily.partner_id, partner)
@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 
 from odoo import exceptions
 from odoo.tests import common
+from odoo.tools import SQL
 
 
 class TestHelpdeskTimesheetTimeControl(common.TransactionCase):
@@ -102,3 +103,32 @@ class TestHelpdeskTimesheetTimeControl(common.TransactionCase):
         self.assertEqual(new_line.ticket_id, self.ticket)
         self.assertEqual(new_line.unit_amount, 0)
         self.assertTrue(self.ticket_line.unit_amount)
+
+    def _explain(self, domain, order=None, limit=None):
+        query = self.env["account.analytic.line"]._search(
+            domain, order=order, limit=limit
+        )
+        # The test tables are tiny, make sure an index is used when possible
+        self.env.cr.execute("SET LOCAL enable_seqscan = off")
+        self.env.cr.execute(SQL("EXPLAIN %s", query.select()))
+        plan = "\n".join(row[0] for row in self.env.cr.fetchall())
+        self.env.cr.execute("SET LOCAL enable_seqscan = on")
+        return plan
+
+    def test_ticket_time_control_indexes(self):
+        # Running timers of the user on the tickets
+        plan = self._explain(
+            [
+                ("ticket_id", "in", self.ticket.ids),
+                ("user_id", "=", self.uid),
+                ("unit_amount", "=", 0),
+            ]
+        )
+        self.assertIn("account_analytic_line_ticket_timer_index", plan)
+        # Latest line of the user on the ticket, see _closest_suggestion
+        plan = self._explain(
+            [("user_id", "=", self.uid), ("ticket_id", "=", self.ticket.id)],
+            order="date_time DESC",
+            limit=1,
+        )
+        self.assertIn("account_analytic_line_ticket_user_date_time_index", plan)
@@ -3,3 +3,4 @@
 from . import helpdesk_ticket
 from . import helpdesk_ticket_stage
 from . import mgmtsystem_nonconformity
+from . import mgmtsystem_nonconformity_stage
@@ -39,9 +39,10 @@ class HelpdeskTicket(models.Model):
         nonconformity_model = self.env["mgmtsystem.nonconformity"].with_context(
             skip_stage_change=True
         )
-        for item in self:
-            item.nonconformity_id = nonconformity_model.create(
-                item._prepare_nonconformity_vals()
+        # The nonconformities are linked to their ticket through ticket_ids
+        for items in self._iter_chunks():
+            nonconformity_model.create(
+                [item._prepare_nonconformity_vals() for item in items]
             )
 
     def action_open_nonconformity(self):
@@ -57,10 +58,12 @@ class HelpdeskTicket(models.Model):
     def write(self, vals):
         res = super().write(vals)
         if vals.get("stage_id") and not self.env.context.get("skip_stage_change"):
-            items = self.mapped("nonconformity_id")
-            stage = self.env["helpdesk.ticket.stage"].browse(vals.get("stage_id"))
-            if stage.nonconformity_stage_id and items:
-                items.with_context(skip_stage_change=True).write(
-                    {"stage_id": stage.nonconformity_stage_id.id}
-                )
+            stage_model = self.env["helpdesk.ticket.stage"]
+            mapping = stage_model._get_nonconformity_stage_mapping()[0]
+            stage_id = mapping.get(vals["stage_id"])
+            items = self.nonconformity_id.filtered(
+                lambda item: item.stage_id.id != stage_id
+            )
+            if stage_id and items:
+                items.with_context(skip_stage_change=True).write({"stage_id": stage_id})
         return res
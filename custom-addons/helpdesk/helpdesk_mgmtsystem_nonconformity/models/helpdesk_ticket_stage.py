@@ -1,7 +1,10 @@
 # Copyright 2021 Tecnativa - Víctor Martínez
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
 
-from odoo import fields, models
+from odoo import api, fields, models, tools
+
+# Changing them changes the stages linked to nonconformity stages
+MAPPING_FIELDS = {"nonconformity_stage_id", "active", "sequence", "company_id"}
 
 
 class HelpdeskTicketStage(models.Model):
@@ -11,3 +14,42 @@ class HelpdeskTicketStage(models.Model):
         comodel_name="mgmtsystem.nonconformity.stage",
         string="Nonconformity Stage",
     )
+
+    @api.model
+    @tools.ormcache()
+    def _get_nonconformity_stage_mapping(self):
+        """Return the stages linked in both ways as two dicts of ids.
+
+        The first one maps ticket stages to their nonconformity stage, the
+        second one ``(nonconformity stage, company)`` pairs to the first ticket
+        stage of that company linked to them, ``False`` standing for the
+        stages shared by all the companies. Shared by all the users, so it
+        lists the stages of every company.
+        """
+        ticket_to_nonconformity = {}
+        nonconformity_to_ticket = {}
+        for stage in self.sudo().search([("nonconformity_stage_id", "!=", False)]):
+            nonconformity_stage_id = stage.nonconformity_stage_id.id
+            ticket_to_nonconformity[stage.id] = nonconformity_stage_id
+            nonconformity_to_ticket.setdefault(
+                (nonconformity_stage_id, stage.company_id.id), stage.id
+            )
+        return ticket_to_nonconformity, nonconformity_to_ticket
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        stages = super().create(vals_list)
+        if any(vals.get("nonconformity_stage_id") for vals in vals_list):
+            self.env.registry.clear_cache()
+        return stages
+
+    def write(self, vals):
+        res = super().write(vals)
+        if MAPPING_FIELDS.intersection(vals):
+            self.env.registry.clear_cache()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env.registry.clear_cache()
+        return res
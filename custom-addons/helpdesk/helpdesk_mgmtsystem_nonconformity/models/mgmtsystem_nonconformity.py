@@ -30,11 +30,18 @@ class MgmtsystemNonconformity(models.Model):
     def write(self, vals):
         res = super().write(vals)
         if vals.get("stage_id") and not self.env.context.get("skip_stage_change"):
-            ticket_stage = self.env["helpdesk.ticket.stage"].search(
-                [("nonconformity_stage_id", "=", vals.get("stage_id"))], limit=1
-            )
-            if ticket_stage and self.ticket_ids:
-                self.ticket_ids.with_context(skip_stage_change=True).write(
-                    {"stage_id": ticket_stage.id}
-                )
+            stage_model = self.env["helpdesk.ticket.stage"]
+            mapping = stage_model._get_nonconformity_stage_mapping()[1]
+            # Each ticket follows the stage of its company, or a shared one
+            ticket_ids_by_stage = {}
+            for ticket in self.ticket_ids:
+                stage_id = mapping.get(
+                    (vals["stage_id"], ticket.company_id.id)
+                ) or mapping.get((vals["stage_id"], False))
+                if stage_id and ticket.stage_id.id != stage_id:
+                    ticket_ids_by_stage.setdefault(stage_id, []).append(ticket.id)
+            for stage_id, ticket_ids in ticket_ids_by_stage.items():
+                self.env["helpdesk.ticket"].browse(ticket_ids).with_context(
+                    skip_stage_change=True
+                ).write({"stage_id": stage_id})
         return res
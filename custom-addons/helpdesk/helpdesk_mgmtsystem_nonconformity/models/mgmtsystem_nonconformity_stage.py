@@ -0,0 +1,13 @@
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+
+from odoo import models
+
+
+class MgmtsystemNonconformityStage(models.Model):
+    _inherit = "mgmtsystem.nonconformity.stage"
+
+    def unlink(self):
+        # The database unlinks them from their ticket stages
+        res = super().unlink()
+        self.env.registry.clear_cache()
+        return res
@@ -41,3 +41,79 @@ class TestMgmtsystemNonconformity(BaseCommon):
         self.assertEqual(ticket.stage_id, self.ticket_stage_2)
         ticket.nonconformity_id.stage_id = self.nonconformity_stage_1
         self.assertEqual(ticket.stage_id, self.ticket_stage_1)
+
+    def test_create_tickets_bulk(self):
+        tickets = self.env["helpdesk.ticket"].create(
+            [
+                {
+                    "name": f"Test ticket {i}",
+                    "partner_id": self.partner.id,
+                    "description": "description",
+                    "stage_id": self.ticket_stage_1.id,
+                }
+                for i in range(3)
+            ]
+        )
+        tickets.action_nonconformity_create()
+        nonconformities = tickets.nonconformity_id
+        self.assertEqual(len(nonconformities), 3)
+        for ticket in tickets:
+            self.assertEqual(ticket.nonconformity_id.ticket_ids, ticket)
+            self.assertEqual(ticket.nonconformity_id.name, ticket.name)
+        tickets.stage_id = self.ticket_stage_2
+        self.assertEqual(nonconformities.stage_id, self.nonconformity_stage_2)
+        nonconformities.stage_id = self.nonconformity_stage_1
+        self.assertEqual(tickets.stage_id, self.ticket_stage_1)
+        # The stage mapping follows the configuration of the stages
+        self.ticket_stage_2.nonconformity_stage_id = self.nonconformity_stage_3
+        tickets.stage_id = self.ticket_stage_2
+        self.assertEqual(nonconformities.stage_id, self.nonconformity_stage_3)
+
+    def test_unlink_nonconformity_stage(self):
+        Stage = self.env["helpdesk.ticket.stage"]
+        mapping = Stage._get_nonconformity_stage_mapping()[0]
+        self.assertEqual(mapping[self.ticket_stage_2.id], self.nonconformity_stage_2.id)
+        self.nonconformity_stage_2.unlink()
+        mapping = Stage._get_nonconformity_stage_mapping()[0]
+        self.assertNotIn(self.ticket_stage_2.id, mapping)
+
+    def test_multi_company_stage(self):
+        company = self.env["res.company"].create({"name": "Other company"})
+        other_stage = self.env["helpdesk.ticket.stage"].create(
+            {
+                "name": "Other stage 1",
+                "sequence": 0,
+                "company_id": company.id,
+                "nonconformity_stage_id": self.nonconformity_stage_1.id,
+            }
+        )
+        shared_stage = self.env["helpdesk.ticket.stage"].create(
+            {
+                "name": "Shared stage 3",
+                "company_id": False,
+                "nonconformity_stage_id": self.nonconformity_stage_3.id,
+            }
+        )
+        tickets = self.env["helpdesk.ticket"].create(
+            [
+                {
+                    "name": "Test ticket",
+                    "partner_id": self.partner.id,
+                    "description": "description",
+                    "stage_id": self.ticket_stage_2.id,
+                },
+                {
+                    "name": "Other ticket",
+                    "partner_id": self.partner.id,
+                    "description": "description",
+                    "company_id": company.id,
+                    "stage_id": self.ticket_stage_2.id,
+                },
+            ]
+        )
+        tickets.action_nonconformity_create()
+        tickets.nonconformity_id.stage_id = self.nonconformity_stage_1
+        self.assertEqual(tickets[0].stage_id, self.ticket_stage_1)
+        self.assertEqual(tickets[1].stage_id, other_stage)
+        tickets.nonconformity_id.stage_id = self.nonconformity_stage_3
+        self.assertEqual(tickets.stage_id, shared_stage)
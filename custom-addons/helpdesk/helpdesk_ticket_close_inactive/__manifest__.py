@@ -2,7 +2,7 @@
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
 {
     "name": "Helpdesk Ticket Close Inactive",
-    "version": "17.0.1.1.1",
+    "version": "17.0.1.3.3",
     "development_status": "Alpha",
     "category": "Helpdesk",
     "website": "https://github.com/OCA/helpdesk",
@@ -0,0 +1,16 @@
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+from odoo import models, tools
+
+
+class HelpdeskTicket(models.Model):
+    _inherit = "helpdesk.ticket"
+
+    def init(self):
+        super().init()
+        # Inactivity scans select tickets of a team and stages by last stage update
+        tools.create_index(
+            self._cr,
+            "helpdesk_ticket_team_stage_last_stage_update_index",
+            self._table,
+            ["team_id", "stage_id", "last_stage_update"],
+        )
@@ -1,8 +1,10 @@
 # Copyright 2024 APSL-Nagarro - Miquel Alzanillas
 import logging
-from datetime import datetime, time, timedelta
+import threading
+from collections import defaultdict
+from datetime import timedelta
 
-from odoo import fields, models
+from odoo import _, fields, models
 
 _logger = logging.getLogger(__name__)
 
@@ -72,95 +74,177 @@ class HelpdeskTicketTeam(models.Model):
         string="Closing Stage",
         help="Set this stage for autoclosing tickets",
     )
+    inactive_tickets_warning_watermark = fields.Datetime(
+        readonly=True,
+        copy=False,
+        help="Technical field: inactivity warnings have been sent for the tickets "
+        "whose last stage update is before this date.",
+    )
+    inactive_tickets_warning_watermark_id = fields.Integer(
+        readonly=True,
+        copy=False,
+        help="Technical field: last ticket warned with a last stage update equal "
+        "to the watermark, used to resume an interrupted run.",
+    )
 
-    def close_team_inactive_tickets(self):
-        if len(self) > 0:
-            teams = self
-        else:
-            teams = self.search([("close_inactive_tickets", "=", True)])
-
-        for team_id in teams:
-            ticket_stage_ids = team_id.ticket_stage_ids.ids
-            ticket_category_ids = team_id.ticket_category_ids.ids
-            warning_limit = datetime.today() - timedelta(
-                days=team_id.inactive_tickets_day_limit_warning
-            )
-            warning_limit_day_first_hour = datetime.combine(warning_limit, time.min)
-            warning_limit_day_last_hour = datetime.combine(warning_limit, time.max)
-            closing_limit = datetime.today() - timedelta(
-                days=team_id.inactive_tickets_day_limit_closing
+    def close_team_inactive_tickets(self, batch_size=500):
+        """Warn about and close the inactive tickets of the teams.
+
+        Every team of ``self`` (or every team with the option enabled when
+        ``self`` is empty) is processed. Tickets are handled in chunks of
+        ``batch_size``: stages are written in bulk, emails are rendered in
+        batch and, outside of tests, each chunk is committed with the team
+        progress so a crashed or timed out run resumes where it stopped.
+        Teams may run concurrently, see ``_run_per_team``.
+        """
+        run_log = self.env["helpdesk.cron.run"]._record(_("Close Inactive Tickets"))
+        with run_log as stats:
+            teams = self or self.search([("close_inactive_tickets", "=", True)])
+            auto_commit = not getattr(threading.current_thread(), "testing", False)
+            result = {"warning_email_ids": [], "closing_email_ids": []}
+            for team_result in teams._run_per_team(
+                "_close_inactive_tickets", batch_size, auto_commit, stats=stats
+            ):
+                result["warning_email_ids"] += team_result["warning_email_ids"]
+                result["closing_email_ids"] += team_result["closing_email_ids"]
+                stats["team_count"] += 1
+                stats["ticket_scanned_count"] += team_result["scanned_count"]
+                stats["ticket_warned_count"] += team_result["warned_count"]
+                stats["ticket_closed_count"] += team_result["closed_count"]
+            stats["mail_count"] = len(result["warning_email_ids"]) + len(
+                result["closing_email_ids"]
             )
-            closing_remaining_days = (
-                team_id.inactive_tickets_day_limit_closing
-                - team_id.inactive_tickets_day_limit_warning
+        return result
+
+    def _get_inactive_tickets_domain(self):
+        self.ensure_one()
+        domain = [
+            ("team_id", "=", self.id),
+            ("stage_id", "in", self.ticket_stage_ids.ids),
+        ]
+        if self.ticket_category_ids:
+            domain.append(("category_id", "in", self.ticket_category_ids.ids))
+        return domain
+
+    def _get_inactive_tickets_warning_domain(self, warning_limit, closing_limit):
+        """Return the domain of the tickets to warn since the previous run.
+
+        Tickets are warned once, when their last stage update crosses the
+        warning limit: the run handles the tickets between the team watermark
+        (the warning limit of the previous run) and the current warning limit,
+        whatever the delay between runs. Tickets already past the closing
+        limit are left to the closing step.
+        """
+        self.ensure_one()
+        watermark = self.inactive_tickets_warning_watermark
+        watermark_id = self.inactive_tickets_warning_watermark_id
+        if not watermark:
+            # Same window as a daily run for the first run of the team
+            watermark, watermark_id = warning_limit - timedelta(days=1), 0
+        if watermark < closing_limit:
+            watermark, watermark_id = closing_limit, 0
+        return self._get_inactive_tickets_domain() + [
+            ("last_stage_update", "<=", warning_limit),
+            "|",
+            ("last_stage_update", ">", watermark),
+            "&",
+            ("last_stage_update", "=", watermark),
+            ("id", ">", watermark_id),
+        ]
+
+    def _close_inactive_tickets(self, batch_size, auto_commit):
+        self.ensure_one()
+        ticket_model = self.env["helpdesk.ticket"]
+        now = fields.Datetime.now()
+        warning_limit = now - timedelta(days=self.inactive_tickets_day_limit_warning)
+        closing_limit = now - timedelta(days=self.inactive_tickets_day_limit_closing)
+        warning_tickets = ticket_model.search(
+            self._get_inactive_tickets_warning_domain(warning_limit, closing_limit),
+            order="last_stage_update, id",
+        )
+        closing_tickets = ticket_model.search(
+            self._get_inactive_tickets_domain()
+            + [("last_stage_update", "<=", closing_limit)],
+            order="id",
+        )
+        warning_email_ids = []
+        for tickets in warning_tickets._iter_chunks(
+            batch_size, ["stage_id", "last_stage_update"], auto_commit
+        ):
+            warning_email_ids += self._send_inactive_tickets_warning(tickets)
+            self.write(
+                {
+                    "inactive_tickets_warning_watermark": tickets[-1].last_stage_update,
+                    "inactive_tickets_warning_watermark_id": tickets[-1].id,
+                }
             )
-            closing_stage = team_id.closing_ticket_stage
-            search_domain = [
-                ("team_id", "=", team_id.id),
-                ("stage_id", "in", ticket_stage_ids),
-                ("last_stage_update", ">=", warning_limit_day_first_hour),
-                ("last_stage_update", "<=", warning_limit_day_last_hour),
-            ]
-
-            if ticket_category_ids:
-                search_domain.append(("category_id", "in", ticket_category_ids))
-
-            warning_ticket_ids = self.env["helpdesk.ticket"].search(search_domain)
-            warning_email_ids = []
-            closing_email_ids = []
-            if warning_ticket_ids:
-                for ticket in warning_ticket_ids:
-                    # Set template context
-                    context = {
-                        "stage": ticket.stage_id.name,
-                        "close": False,
-                        "remaining_days": closing_remaining_days,
-                    }
-                    # Send warning email
-                    warning_email_id = (
-                        team_id.warning_inactive_mail_template_id.with_context(
-                            **context
-                        ).send_mail(ticket.id)
-                    )
-                    if warning_email_id:
-                        _logger.info(
-                            "Sending warning ticket email for %s", ticket.number
-                        )
-                        warning_email_ids.append(warning_email_id)
-
-            closing_ticket_domain = [
-                ("team_id", "=", team_id.id),
-                ("stage_id", "in", ticket_stage_ids),
-                ("last_stage_update", "<=", closing_limit),
-            ]
-            if ticket_category_ids:
-                closing_ticket_domain.append(("category_id", "in", ticket_category_ids))
-
-            closing_ticket_ids = self.env["helpdesk.ticket"].search(
-                closing_ticket_domain
+        watermark = self.inactive_tickets_warning_watermark
+        if not watermark or watermark < warning_limit:
+            self.write(
+                {
+                    "inactive_tickets_warning_watermark": warning_limit,
+                    "inactive_tickets_warning_watermark_id": 0,
+                }
             )
+        closing_email_ids = []
+        for tickets in closing_tickets._iter_chunks(
+            batch_size, ["stage_id"], auto_commit
+        ):
+            closing_email_ids += self._close_inactive_tickets_batch(tickets)
+        _logger.info(
+            "Team %s: %s inactive tickets warned, %s closed",
+            self.name,
+            len(warning_tickets),
+            len(closing_tickets),
+        )
+        return {
+            "warning_email_ids": warning_email_ids,
+            "closing_email_ids": closing_email_ids,
+            "scanned_count": len(warning_tickets) + len(closing_tickets),
+            "warned_count": len(warning_tickets),
+            "closed_count": len(closing_tickets),
+        }
+
+    def _send_inactive_tickets_mails(self, template, tickets_by_stage, **context):
+        """Render and queue ``template`` in batch for each group of tickets.
+
+        :param tickets_by_stage: tickets grouped by the stage to put in the
+            rendering context
+        :return: ids of the queued ``mail.mail``
+        """
+        if not template:
+            return []
+        mail_ids = []
+        for stage, tickets in tickets_by_stage.items():
+            mails = template.with_context(
+                stage=stage.name, **context
+            ).send_mail_batch(tickets.ids)
+            mail_ids += mails.ids
+        return mail_ids
+
+    def _send_inactive_tickets_warning(self, tickets):
+        self.ensure_one()
+        return self._send_inactive_tickets_mails(
+            self.warning_inactive_mail_template_id,
+            tickets.grouped("stage_id"),
+            close=False,
+            remaining_days=(
+                self.inactive_tickets_day_limit_closing
+                - self.inactive_tickets_day_limit_warning
+            ),
+        )
 
-            if closing_ticket_ids:
-                for ticket in closing_ticket_ids:
-                    context = {"stage": ticket.stage_id.name, "close": True}
-                    ticket.write({"stage_id": closing_stage.id})
-                    # Send closing email
-                    closing_email_id = (
-                        team_id.close_inactive_mail_template_id.with_context(
-                            **context
-                        ).send_mail(ticket.id)
-                    )
-                    if closing_email_id:
-                        _logger.info(
-                            "Sending autoclosing ticket email for %s", ticket.number
-                        )
-                        closing_email_ids.append(closing_email_id)
-
-                        # Log atomated closing ticket action into chatter
-                        msg = "Ticket closed automatically because have \
-                        reached the inactivity days limit"
-                        ticket.message_post(body=msg)
-            return {
-                "warning_email_ids": warning_email_ids,
-                "closing_email_ids": closing_email_ids,
-            }
+    def _close_inactive_tickets_batch(self, tickets):
+        self.ensure_one()
+        # Mails are rendered with the stage the tickets were in before closing
+        tickets_by_stage = tickets.grouped("stage_id")
+        tickets.write({"stage_id": self.closing_ticket_stage.id})
+        mail_ids = self._send_inactive_tickets_mails(
+            self.close_inactive_mail_template_id, tickets_by_stage, close=True
+        )
+        message = _(
+            "Ticket closed automatically because have reached the inactivity "
+            "days limit"
+        )
+        tickets._message_log_batch(bodies=dict.fromkeys(tickets.ids, message))
+        return mail_ids
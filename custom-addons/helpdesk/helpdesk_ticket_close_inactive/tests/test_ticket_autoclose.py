@@ -1,6 +1,8 @@
 # Copyright 2024 APSL-Nagarro - Miquel Alzanillas
 from datetime import datetime, timedelta
 
+from odoo import fields
+
 from odoo.addons.base.tests.common import BaseCommon
 
 
@@ -120,3 +122,52 @@ class TestHelpdeskTicketAutoclose(BaseCommon):
             self.stage_closing,
             "Ticket should be moved to the closing stage",
         )
+
+    def test_all_teams_processed(self):
+        """Test that every team is processed in a single cron run."""
+        self.ticket.write({"last_stage_update": datetime.today() - timedelta(days=15)})
+        self.ticket2.write({"last_stage_update": datetime.today() - timedelta(days=15)})
+        teams = self.team | self.team_without_category
+        result = teams.close_team_inactive_tickets(batch_size=1)
+        self.assertEqual(self.ticket.stage_id, self.stage_closing)
+        self.assertEqual(self.ticket2.stage_id, self.stage_closing)
+        self.assertEqual(len(result["closing_email_ids"]), 2)
+        self.assertTrue(
+            any(
+                "inactivity days limit" in body
+                for body in self.ticket.message_ids.mapped("body")
+            )
+        )
+
+    def test_warning_sent_once(self):
+        """Test that tickets are warned only once, on the run after they cross
+        the warning limit."""
+        result = self.team.close_team_inactive_tickets()
+        self.assertEqual(len(result["warning_email_ids"]), 1)
+        self.assertGreaterEqual(
+            self.team.inactive_tickets_warning_watermark, self.ticket.last_stage_update
+        )
+        result = self.team.close_team_inactive_tickets()
+        self.assertFalse(result["warning_email_ids"])
+
+    def test_warning_after_skipped_runs(self):
+        """Test that a delayed run still warns the tickets that crossed the
+        warning limit since the previous run."""
+        now = fields.Datetime.now()
+        self.team.inactive_tickets_warning_watermark = now - timedelta(days=12)
+        self.ticket.write({"last_stage_update": now - timedelta(days=10)})
+        result = self.team.close_team_inactive_tickets()
+        self.assertEqual(len(result["warning_email_ids"]), 1)
+        self.assertNotEqual(self.ticket.stage_id, self.stage_closing)
+
+    def test_cron_run_logged(self):
+        """Test that each run records its telemetry."""
+        self.ticket.write({"last_stage_update": datetime.today() - timedelta(days=15)})
+        self.team.close_team_inactive_tickets()
+        run = self.env["helpdesk.cron.run"].search([], limit=1)
+        self.assertEqual(run.state, "done")
+        self.assertEqual(run.team_count, 1)
+        self.assertEqual(run.ticket_closed_count, 1)
+        self.assertEqual(run.mail_count, 1)
+        self.assertTrue(run.query_count)
+        self.assertGreaterEqual(run.memory_increase, 0.0)
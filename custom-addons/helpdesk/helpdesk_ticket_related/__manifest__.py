@@ -3,7 +3,7 @@
 {
     "name": "Helpdesk Ticket Related",
     "summary": "Link tickets to each other",
-    "version": "17.0.1.0.0",
+    "version": "17.0.1.1.1",
     "category": "Helpdesk",
     "website": "https://github.com/OCA/helpdesk",
     "author": "Antoni Marroig, APSL-Nagarro, Odoo Community Association (OCA)",
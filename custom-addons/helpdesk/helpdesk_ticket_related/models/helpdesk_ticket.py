@@ -1,7 +1,9 @@
 # Copyright 2024 Antoni Marroig(APSL-Nagarro)<amarroig@apsl.net>
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
 
-from odoo import fields, models
+from psycopg2.extras import execute_values
+
+from odoo import _, api, fields, models
 
 
 class HelpdeskTicket(models.Model):
@@ -15,21 +17,111 @@ class HelpdeskTicket(models.Model):
         string="Related tickets",
     )
 
+    def init(self):
+        super().init()
+        # Make links created before the relation was kept symmetric mutual
+        self.env.cr.execute(
+            """
+            INSERT INTO ticket_relationship_table (ticket_id1, ticket_id2)
+            SELECT ticket_id2, ticket_id1 FROM ticket_relationship_table
+            ON CONFLICT DO NOTHING
+            """
+        )
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        tickets = super().create(vals_list)
+        if any(vals.get("related_ticket_ids") for vals in vals_list):
+            tickets._sync_related_tickets(set())
+        return tickets
+
     def write(self, vals):
-        if "related_ticket_ids" in vals:
-            for ticket in self.related_ticket_ids:
-                if (
-                    6 == vals.get("related_ticket_ids")[0][0]
-                    and ticket.id not in vals.get("related_ticket_ids")[0][2]
-                ):
-                    ticket.write({"related_ticket_ids": [(3, self.id)]})
+        if "related_ticket_ids" not in vals:
+            return super().write(vals)
+        links = self._get_related_links()
         res = super().write(vals)
-        if "related_ticket_ids" in vals:
-            for rel_ticket in self.related_ticket_ids:
-                if self._origin.id not in rel_ticket.related_ticket_ids.ids:
-                    rel_ticket.write({"related_ticket_ids": [(4, self.id)]})
+        self._sync_related_tickets(links)
         return res
 
+    def _get_related_links(self):
+        """Return the ``(ticket, related ticket)`` id pairs of the tickets."""
+        if not self.ids:
+            return set()
+        self.flush_model(["related_ticket_ids"])
+        self.env.cr.execute(
+            """
+            SELECT ticket_id1, ticket_id2 FROM ticket_relationship_table
+             WHERE ticket_id1 IN %s
+            """,
+            [tuple(self.ids)],
+        )
+        return set(self.env.cr.fetchall())
+
+    def _sync_related_tickets(self, old_links):
+        """Mirror the link changes of the tickets on the related tickets.
+
+        :param old_links: ``(ticket, related ticket)`` id pairs of the tickets
+            before the change
+        """
+        new_links = self._get_related_links()
+        to_add = {(id2, id1) for id1, id2 in new_links - old_links}
+        to_remove = {(id2, id1) for id1, id2 in old_links - new_links} - new_links
+        if not to_add and not to_remove:
+            return
+        related_tickets = self.browse(list({id1 for id1, _id2 in to_add | to_remove}))
+        related_tickets.check_access_rights("write")
+        related_tickets.check_access_rule("write")
+        if to_remove:
+            self.env.cr.execute(
+                """
+                DELETE FROM ticket_relationship_table
+                 WHERE (ticket_id1, ticket_id2) IN %s
+                """,
+                [tuple(to_remove)],
+            )
+        if to_add:
+            execute_values(
+                self.env.cr._obj,
+                """
+                INSERT INTO ticket_relationship_table (ticket_id1, ticket_id2)
+                VALUES %s
+                ON CONFLICT DO NOTHING
+                """,
+                list(to_add),
+            )
+        related_tickets.invalidate_recordset(["related_ticket_ids"])
+        related_tickets.modified(["related_ticket_ids"])
+
+    def _get_related_cluster(self):
+        """Return all the tickets linked to the tickets, directly or not."""
+        if not self.ids:
+            return self.browse()
+        self.flush_model(["related_ticket_ids"])
+        self.env.cr.execute(
+            """
+            WITH RECURSIVE cluster(id) AS (
+                SELECT unnest(%s::int[])
+                 UNION
+                SELECT rel.ticket_id2
+                  FROM ticket_relationship_table rel
+                  JOIN cluster ON cluster.id = rel.ticket_id1
+            )
+            SELECT id FROM cluster
+            """,
+            [list(self.ids)],
+        )
+        return self.browse([row[0] for row in self.env.cr.fetchall()])
+
+    def action_open_related_cluster(self):
+        self.ensure_one()
+        return {
+            "type": "ir.actions.act_window",
+            "name": _("Related Tickets Cluster"),
+            "view_mode": "tree,form",
+            "res_model": "helpdesk.ticket",
+            "domain": [("id", "in", self._get_related_cluster().ids)],
+        }
+
     def open_ticket(self):
         return {
             "type": "ir.actions.act_window",
@@ -20,6 +20,39 @@ class HelpdeskTicketRelatedTickets(TransactionCase):
         self.ticket1.related_ticket_ids = [[6, False, []]]
         self.assertEqual(self.ticket2.related_ticket_ids.ids, [])
 
+    def test_link_tickets_bulk(self):
+        tickets = self.env["helpdesk.ticket"].create(
+            [{"name": f"Ticket {i}", "description": "Ticket"} for i in range(3)]
+        )
+        (self.ticket1 | self.ticket2).related_ticket_ids = [(6, 0, tickets.ids)]
+        for ticket in tickets:
+            self.assertEqual(ticket.related_ticket_ids, self.ticket1 | self.ticket2)
+        self.ticket1.related_ticket_ids = [(3, tickets[0].id)]
+        self.assertEqual(tickets[0].related_ticket_ids, self.ticket2)
+        self.assertEqual(tickets[1].related_ticket_ids, self.ticket1 | self.ticket2)
+
+    def test_create_linked_ticket(self):
+        ticket = self.env["helpdesk.ticket"].create(
+            {
+                "name": "Ticket",
+                "description": "Ticket",
+                "related_ticket_ids": [(6, 0, self.ticket1.ids)],
+            }
+        )
+        self.assertEqual(self.ticket1.related_ticket_ids, ticket)
+
+    def test_related_cluster(self):
+        tickets = self.env["helpdesk.ticket"].create(
+            [{"name": f"Ticket {i}", "description": "Ticket"} for i in range(4)]
+        )
+        # Chain 0 - 1 - 2, ticket 3 is not linked
+        tickets[0].related_ticket_ids = [(4, tickets[1].id)]
+        tickets[1].related_ticket_ids = [(4, tickets[2].id)]
+        self.assertEqual(tickets[2]._get_related_cluster(), tickets[:3])
+        self.assertEqual(tickets[3]._get_related_cluster(), tickets[3])
+        action = tickets[0].action_open_related_cluster()
+        self.assertEqual(sorted(action["domain"][0][2]), sorted(tickets[:3].ids))
+
     def test_open_ticket(self):
         self.assertEqual(
             self.ticket1.open_ticket(),